@@ -19,7 +19,7 @@ parser = argparse.ArgumentParser(description='TrustyClaw Demo', allow_abbrev=Tru
 parser.add_argument('--mock', action='store_true', default=False, help='Use mock mode explicitly')
 parser.add_argument('--onchain', action='store_true', default=False, help='Use real on-chain contracts (REQUIRES anchor programs deployed)')
 
-USE_MOCK = True  # default when imported (e.g. by tests); overridden in __main__
+USE_MOCK = True  # default when imported (e.g. by tests); cli() sets it from the flags
 
 def check_anchor_deployed() -> bool:
     """Check if Anchor programs are deployed"""
@@ -276,8 +276,10 @@ def main():
     print("Hackathon: Colosseum Agent Hackathon (Feb 2-12, 2026)")
 
 
-if __name__ == "__main__":
-    args = parser.parse_args()
+def cli(argv=None):
+    """Parse command-line flags, report the mode and run the demo"""
+    global USE_MOCK
+    args = parser.parse_args(argv)
     USE_MOCK = args.mock or not args.onchain  # Mock by default, --onchain overrides
     if USE_MOCK:
         print("⚠ Mock mode - Run with --onchain for real on-chain operations")
@@ -299,3 +301,7 @@ if __name__ == "__main__":
         print(f"   Escrow Program: {os.environ.get('ESCROW_PROGRAM_ID', 'default')[:16]}...")
         print(f"   Reputation Program: {os.environ.get('REPUTATION_PROGRAM_ID', 'default')[:16]}...")
     main()
+
+
+if __name__ == "__main__":
+    cli()
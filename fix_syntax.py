@@ -1,10 +1,16 @@
-import re
-with open('src/trustyclaw/sdk/escrow_contract.py', 'r') as f:
-    content = f.read()
-content = re.sub(r'\\\\&quot;', "'", content)
-content = re.sub(r'\\\\\"', "'", content)
-content = re.sub(r'&quot;', "'", content)
-content = re.sub(r'&amp;#x27;', "'", content)
-with open('src/trustyclaw/sdk/escrow_contract.py', 'w') as f:
-    f.write(content)
-print('Fixed')
\ No newline at end of file
+from pathlib import Path
+
+path = Path('src/trustyclaw/sdk/escrow_contract.py')
+content = path.read_text()
+fixed = (
+    content.replace('\\\\&quot;', "'")
+    .replace('\\\\"', "'")
+    .replace('&quot;', "'")
+    .replace('&amp;#x27;', "'")
+    .replace('&#x27;', "'")
+)
+if fixed != content:
+    path.write_text(fixed)
+    print('Fixed')
+else:
+    print('Nothing to fix')
\ No newline at end of file
@@ -23,7 +23,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -35,19 +35,25 @@ from trustyclaw.sdk.reputation import ReputationEngine, Review
 
 # ============ Devnet Wallets ============
 
+class Wallet(NamedTuple):
+    """A named devnet wallet"""
+    address: str
+    name: str
+
+
 WALLETS = {
-    "agent": {
-        "address": "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q",
-        "name": "Happy Claw (Agent)",
-    },
-    "renter": {
-        "address": "3WaHbF7k9ced4d2wA8caUHq2v57ujD4J2c57L8wZXfhN",
-        "name": "Renter Agent",
-    },
-    "provider": {
-        "address": "HajVDaadfi6vxrt7y6SRZWBHVYCTscCc8Cwurbqbmg5B",
-        "name": "Provider Agent",
-    },
+    "agent": Wallet(
+        address="GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q",
+        name="Happy Claw (Agent)",
+    ),
+    "renter": Wallet(
+        address="3WaHbF7k9ced4d2wA8caUHq2v57ujD4J2c57L8wZXfhN",
+        name="Renter Agent",
+    ),
+    "provider": Wallet(
+        address="HajVDaadfi6vxrt7y6SRZWBHVYCTscCc8Cwurbqbmg5B",
+        name="Provider Agent",
+    ),
 }
 
 # ============ Demo Skills (Real Wallet Addresses) ============
@@ -56,8 +62,8 @@ DEMO_SKILLS = [
     {
         "id": "image-generation",
         "name": "Image Generation",
-        "provider": WALLETS["agent"]["address"],
-        "provider_name": WALLETS["agent"]["name"],
+        "provider": WALLETS["agent"].address,
+        "provider_name": WALLETS["agent"].name,
         "price_usdc": 0.01,
         "description": "Generate images from text prompts using SDXL",
         "capabilities": ["text-to-image", "style-transfer", "inpainting"],
@@ -65,8 +71,8 @@ DEMO_SKILLS = [
     {
         "id": "code-review",
         "name": "Code Review",
-        "provider": WALLETS["provider"]["address"],
-        "provider_name": WALLETS["provider"]["name"],
+        "provider": WALLETS["provider"].address,
+        "provider_name": WALLETS["provider"].name,
         "price_usdc": 0.05,
         "description": "Automated code review with security checks",
         "capabilities": ["security-scan", "bug-detection", "style-check"],
@@ -74,8 +80,8 @@ DEMO_SKILLS = [
     {
         "id": "data-analysis",
         "name": "Data Analysis",
-        "provider": WALLETS["provider"]["address"],
-        "provider_name": WALLETS["provider"]["name"],
+        "provider": WALLETS["provider"].address,
+        "provider_name": WALLETS["provider"].name,
         "price_usdc": 0.02,
         "description": "Statistical analysis and visualization",
         "capabilities": ["regression", "clustering", "charts"],
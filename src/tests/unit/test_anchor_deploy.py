@@ -9,9 +9,16 @@ Run with: python3 -m pytest src/tests/unit/test_anchor_deploy.py -v
 import os
 import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 
+# demo.py lives at the repo root; run it in-process instead of spawning python
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+from demo import cli
+
 
 class TestAnchorDeployment:
     """Test Anchor program deployment to devnet"""
@@ -75,40 +82,26 @@ class TestAnchorDeployment:
 class TestDemoMockMode:
     """Test demo.py in mock mode"""
     
-    def test_demo_help(self):
+    def test_demo_help(self, capsys):
         """Verify demo.py --help works"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py', '--help'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        assert result.returncode == 0, f"--help failed: {result.stderr}"
-        assert '--mock' in result.stdout, "--mock flag not in help"
-        assert '--onchain' in result.stdout, "--onchain flag not in help"
+        with pytest.raises(SystemExit) as exc_info:
+            cli(['--help'])
+        out = capsys.readouterr().out
+        assert exc_info.value.code == 0, "--help failed"
+        assert '--mock' in out, "--mock flag not in help"
+        assert '--onchain' in out, "--onchain flag not in help"
     
-    def test_demo_mock_runs(self):
+    def test_demo_mock_runs(self, capsys):
         """Verify demo.py --mock runs without errors"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py', '--mock'],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        assert result.returncode == 0, f"Demo --mock failed: {result.stderr}"
-        assert 'DEMO COMPLETE!' in result.stdout, "Demo did not complete"
+        cli(['--mock'])
+        assert 'DEMO COMPLETE!' in capsys.readouterr().out, "Demo did not complete"
     
-    def test_demo_default_is_mock(self):
+    def test_demo_default_is_mock(self, capsys):
         """Verify demo.py defaults to mock mode"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py'],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        assert result.returncode == 0, f"Demo default failed: {result.stderr}"
-        assert 'DEMO COMPLETE!' in result.stdout, "Demo did not complete"
-        assert 'Mock mode' in result.stdout, "Mock mode message not shown"
+        cli([])
+        out = capsys.readouterr().out
+        assert 'DEMO COMPLETE!' in out, "Demo did not complete"
+        assert 'Mock mode' in out, "Mock mode message not shown"
 
 
 class TestDemoOnchainMode:
@@ -116,14 +109,10 @@ class TestDemoOnchainMode:
     
     def test_demo_onchain_flag(self):
         """Verify demo.py --onchain flag is recognized"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py', '--onchain', '--help'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
         # Should not fail on argument parsing
-        assert result.returncode == 0 or 'Unrecognized arguments' in result.stderr
+        with pytest.raises(SystemExit) as exc_info:
+            cli(['--onchain', '--help'])
+        assert exc_info.value.code == 0
 
 
 class TestEscrowClient:
@@ -180,35 +169,25 @@ class TestReputationChain:
 class TestFullDemo:
     """Full integration tests for demo.py"""
     
-    def test_full_demo_sections(self):
+    def test_full_demo_sections(self, capsys):
         """Verify all demo sections execute"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py', '--mock'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
-        
-        assert result.returncode == 0, f"Full demo failed: {result.stderr}"
+        cli(['--mock'])
+        out = capsys.readouterr().out
         
         # Verify all sections ran
-        assert 'SOLANA INTEGRATION' in result.stdout
-        assert 'USDC TOKEN' in result.stdout
-        assert 'ESCROW CONTRACT' in result.stdout
-        assert 'REVIEW SYSTEM' in result.stdout
-        assert 'MANDATE SKILL' in result.stdout
-        assert 'DISCOVERY SKILL' in result.stdout
-        assert 'REPUTATION SKILL' in result.stdout
-        assert 'ON-CHAIN REPUTATION' in result.stdout
+        assert 'SOLANA INTEGRATION' in out
+        assert 'USDC TOKEN' in out
+        assert 'ESCROW CONTRACT' in out
+        assert 'REVIEW SYSTEM' in out
+        assert 'MANDATE SKILL' in out
+        assert 'DISCOVERY SKILL' in out
+        assert 'REPUTATION SKILL' in out
+        assert 'ON-CHAIN REPUTATION' in out
     
-    def test_demo_features_count(self):
+    def test_demo_features_count(self, capsys):
         """Verify all 8 features are demonstrated"""
-        result = subprocess.run(
-            [sys.executable, 'demo.py', '--mock'],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
+        cli(['--mock'])
+        out = capsys.readouterr().out
         
         features = [
             'SOLANA INTEGRATION',
@@ -222,7 +201,7 @@ class TestFullDemo:
         ]
         
         for feature in features:
-            assert feature in result.stdout, f"Missing feature: {feature}"
+            assert feature in out, f"Missing feature: {feature}"
 
 
 if __name__ == '__main__':
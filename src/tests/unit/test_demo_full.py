@@ -5,10 +5,12 @@ Full demo tests - verify all sections can be imported and called without crashin
 
 import pytest
 import sys
+from pathlib import Path
 
 # Mimic demo.py path setup - add both src and root for demo imports
-sys.path.insert(0, 'src')
-sys.path.insert(0, '.')
+ROOT = Path(__file__).parents[3]
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT))
 
 from demo import (
     demo_solana,
@@ -163,9 +163,8 @@ class TestEscrowTransaction:
 class TestEscrowClient:
     """Tests for EscrowClient (sync methods)"""
     
-    def test_client_init(self):
+    def test_client_init(self, client):
         """Test client initialization"""
-        client = EscrowClient()
         assert client.network == "devnet"
         assert client.USDC_MINT == "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
     
@@ -187,9 +186,8 @@ class TestEscrowClient:
         assert terms.price_usdc == 50000  # 0.05 * 1_000_000
         assert terms.duration_seconds == 7200
     
-    def test_format_escrow(self, funded_escrow):
+    def test_format_escrow(self, client, funded_escrow):
         """Test escrow formatting"""
-        client = EscrowClient()
         formatted = client.format_escrow(funded_escrow)
         
         assert "Escrow" in formatted
@@ -246,6 +244,12 @@ class TestEscrowStateMachine:
 
 # ============ Pytest Fixtures ============
 
+@pytest.fixture(scope="module")
+def client():
+    """Default devnet EscrowClient shared by read-only tests"""
+    return EscrowClient()
+
+
 @pytest.fixture
 def sample_terms():
     """Create sample escrow terms"""
@@ -32,6 +32,29 @@ class TestEscrowClient:
         
         client = EscrowClient()
         assert client is not None
+    
+    def test_payment_service_is_cached(self):
+        """Test payment service methods are bound to the client"""
+        from trustyclaw.sdk.escrow_contract import get_escrow_with_payment_service
+        
+        client = get_escrow_with_payment_service(recovery_wallet="recovery-wallet")
+        service = client.get_payment_service()
+        assert service is client.payment_service
+        assert service.multisig_config.recovery_signer == "recovery-wallet"
+    
+    def test_execute_payment_with_confirmation(self):
+        """Test executing a payment intent through the client"""
+        from trustyclaw.sdk.escrow_contract import EscrowClient
+        
+        client = EscrowClient()
+        intent = client.create_payment_intent(
+            provider="provider-wallet",
+            renter="renter-wallet",
+            amount=1_000_000,
+            description="Test payment",
+        )
+        result = client.execute_payment_with_confirmation(intent.intent_id, max_retries=0)
+        assert result.success is True
 
 
 if __name__ == "__main__":
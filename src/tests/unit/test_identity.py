@@ -1,5 +1,7 @@
 """Tests for Identity Module"""
 
+from dataclasses import asdict
+
 import pytest
 from pydantic import ValidationError
 
@@ -37,7 +39,7 @@ class TestAgentIdentity:
             email="test@example.com",
         )
 
-        data = identity.__dict__
+        data = asdict(identity)
 
         assert data["name"] == "TestAgent"
         assert data["email"] == "test@example.com"
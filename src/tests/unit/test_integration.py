@@ -27,7 +27,14 @@ class TestSolanaIntegration(unittest.TestCase):
         # Mainnet client
         client = get_client("mainnet")
         self.assertEqual(client.network, Network.MAINNET)
-    
+
+    def test_client_reused_per_network(self):
+        """Test clients for the same network share one RPC connection pool"""
+        from trustyclaw.sdk.solana import get_client
+
+        self.assertIs(get_client("devnet").client, get_client("devnet").client)
+        self.assertIsNot(get_client("devnet").client, get_client("testnet").client)
+
     def test_wallet_info(self):
         """Test wallet info dataclass"""
         from trustyclaw.sdk.solana import WalletInfo
@@ -54,6 +61,30 @@ class TestSolanaIntegration(unittest.TestCase):
         self.assertGreater(balance.lamports, 0)
         self.assertGreaterEqual(balance.usdc_balance, 0)
     
+    def test_get_balances_batches_requests(self):
+        """Test many balances are fetched in getMultipleAccounts chunks"""
+        from types import SimpleNamespace
+        from unittest import mock
+        from trustyclaw.sdk.solana import get_client
+
+        client = get_client("devnet")
+        address = "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
+        addresses = [address] * (client.MAX_MULTIPLE_ACCOUNTS + 1)
+
+        def fake_get_multiple_accounts(pubkeys, commitment=None):
+            accounts = [SimpleNamespace(lamports=5)] * (len(pubkeys) - 1) + [None]
+            return SimpleNamespace(value=accounts)
+
+        with mock.patch.object(
+            client.client, "get_multiple_accounts", side_effect=fake_get_multiple_accounts
+        ) as rpc:
+            wallets = client.get_balances(addresses)
+
+        self.assertEqual(rpc.call_count, 2)
+        self.assertEqual(len(wallets), len(addresses))
+        self.assertEqual(wallets[0].lamports, 5)
+        self.assertEqual(wallets[-1].lamports, 0)
+
     def test_escrow_pda_derivation(self):
         """Test escrow PDA derivation"""
         from trustyclaw.sdk.solana import get_client
@@ -5,10 +5,8 @@ Tests the real Solana reputation program deployment and interactions.
 """
 
 import pytest
-import hashlib
 import time
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import Mock
 
 from trustyclaw.sdk.reputation_chain import (
     ReputationChainSDK,
@@ -136,14 +134,15 @@ class TestReviewData:
         assert restored.completed_on_time == original.completed_on_time
 
 
+@pytest.fixture(scope="class")
+def sdk():
+    """Create SDK instance shared by the read-only TestReputationChainSDK tests"""
+    return ReputationChainSDK(network="devnet")
+
+
 class TestReputationChainSDK:
     """Test the ReputationChainSDK"""
     
-    @pytest.fixture
-    def sdk(self):
-        """Create SDK instance for testing"""
-        return ReputationChainSDK(network="devnet")
-    
     def test_derive_reputation_pda(self, sdk):
         """Test PDA derivation"""
         pda, bump = sdk.derive_reputation_pda("TestAgent123")
@@ -2,24 +2,28 @@
 Unit Tests for Reputation Program
 Tests verify reputation state machine and basic operations.
 """
+import operator
+from dataclasses import replace
+
 import pytest
 from trustyclaw.sdk.reputation import (
     ReputationEngine, ReputationScore, Review, Rating,
 )
 
 class TestReview:
-    def test_create_review(self):
-        review = Review(provider="agent_wallet", renter="client_wallet", skill="code-generation", rating=5, completed_on_time=True, output_quality="excellent", comment="Great work!")
-        assert review.provider == "agent_wallet"
-        assert review.rating == 5
-
-    def test_review_validate_valid(self):
-        review = Review(provider="valid_agent", renter="valid_client", skill="code", rating=5)
-        assert review.validate() is True
-
-    def test_review_validate_invalid(self):
-        review = Review(provider="", renter="client", skill="code", rating=5)
-        assert review.validate() is False
+    @pytest.mark.parametrize(("kwargs", "expected_rating", "expected_valid"), [
+        (dict(provider="agent_wallet", renter="client_wallet", skill="code-generation", rating=5, completed_on_time=True, output_quality="excellent", comment="Great work!"), 5, True),
+        (dict(provider="valid_agent", renter="valid_client", skill="code", rating=5), 5, True),
+        (dict(provider="", renter="client", skill="code", rating=5), 5, False),
+        *[(dict(provider="agent", renter="client", skill="code", rating=r), r, True) for r in range(1, 6)],
+        (dict(provider="agent", renter="client", skill="code", rating=0), 0, False),
+        (dict(provider="agent", renter="client", skill="code", rating=6), 6, False),
+    ])
+    def test_review_properties(self, kwargs, expected_rating, expected_valid):
+        review = Review(**kwargs)
+        assert review.provider == kwargs["provider"]
+        assert review.rating == expected_rating
+        assert review.validate() is expected_valid
 
 class TestReputationScore:
     def test_create_score(self):
@@ -31,10 +35,17 @@ class TestReputationScore:
         score = ReputationScore(agent_id="reviewed_agent", total_reviews=10, average_rating=4.5, on_time_percentage=95.0, reputation_score=87)
         assert score.total_reviews == 10
 
-    def test_calculate_score_formula(self):
-        score = ReputationScore(agent_id="formula_test", total_reviews=5, average_rating=4.0, on_time_percentage=80.0, reputation_score=0)
+    @pytest.mark.parametrize("reviews,rating,on_time,op,threshold", [
+        (0, 0.0, 0.0, operator.eq, 50.0),
+        (5, 4.0, 80.0, operator.gt, 0.0),
+        (5, 4.5, 90.0, operator.gt, 50.0),
+        (100, 5.0, 100.0, operator.ge, 90.0),
+    ])
+    def test_calculate_score_formula(self, reviews, rating, on_time, op, threshold):
+        score = ReputationScore(agent_id="formula_test", total_reviews=reviews, average_rating=rating, on_time_percentage=on_time, reputation_score=0)
         calculated = score.calculate_score()
-        assert calculated > 0
+        assert op(calculated, threshold)
+        assert score.reputation_score == calculated
 
 class TestReputationEngine:
     def test_engine_initialization(self):
@@ -49,18 +60,38 @@ class TestReputationEngine:
 
     def test_multiple_reviews(self):
         engine = ReputationEngine()
-        for i, rating in enumerate([5, 4, 5, 5, 4]):
-            review = Review(provider="rated_agent", renter=f"client_{i}", skill="test", rating=rating)
-            engine.add_review("rated_agent", review)
+        template = Review(provider="rated_agent", renter="", skill="test")
+        reviews = [
+            replace(template, renter=f"client_{i}", rating=rating)
+            for i, rating in enumerate([5, 4, 5, 5, 4])
+        ]
+        engine.add_reviews("rated_agent", reviews)
         score = engine.get_score("rated_agent")
         assert score is not None
 
+    def test_add_reviews_matches_single_adds(self):
+        reviews = [
+            Review(provider="bulk_agent", renter=f"client_{i}", skill="test", rating=rating, completed_on_time=i % 2 == 0)
+            for i, rating in enumerate([5, 3, 4, 2])
+        ]
+        single = ReputationEngine()
+        for review in reviews:
+            single.add_review("bulk_agent", review)
+        bulk = ReputationEngine()
+        score = bulk.add_reviews("bulk_agent", reviews)
+        expected = single.get_score("bulk_agent")
+        assert score.total_reviews == expected.total_reviews == 4
+        assert score.average_rating == expected.average_rating
+        assert score.on_time_percentage == expected.on_time_percentage
+        assert score.reputation_score == expected.reputation_score
+
     def test_get_top_agents(self):
         engine = ReputationEngine()
+        add = engine.add_review
         for i in range(5):
+            template = Review(provider=f"agent_{i}", renter="", skill="test", rating=min(i + 3, 5))
             for j in range(i + 1):
-                review = Review(provider=f"agent_{i}", renter=f"client_{i}_{j}", skill="test", rating=min(i + 3, 5))
-                engine.add_review(f"agent_{i}", review)
+                add(f"agent_{i}", replace(template, renter=f"client_{i}_{j}"))
         top_agents = engine.get_top_agents()
         assert isinstance(top_agents, list)
 
@@ -73,29 +104,34 @@ class TestReputationEngine:
 class TestEdgeCases:
     def test_all_one_star_reviews(self):
         engine = ReputationEngine()
+        review = Review(provider="bad_agent", renter="client", skill="test", rating=1)
+        add = engine.add_review
         for _ in range(5):
-            review = Review(provider="bad_agent", renter="client", skill="test", rating=1)
-            engine.add_review("bad_agent", review)
+            add("bad_agent", review)
         score = engine.get_score("bad_agent")
         assert score.average_rating == 1.0
         assert score.reputation_score < 50.0
 
     def test_all_five_star_reviews(self):
         engine = ReputationEngine()
+        review = Review(provider="great_agent", renter="client", skill="test", rating=5)
+        add = engine.add_review
         for _ in range(10):
-            review = Review(provider="great_agent", renter="client", skill="test", rating=5)
-            engine.add_review("great_agent", review)
+            add("great_agent", review)
         score = engine.get_score("great_agent")
         assert score.average_rating == 5.0
         assert score.reputation_score > 50.0
 
 class TestRatingEnum:
-    def test_all_ratings_defined(self):
-        assert Rating.ONE_STAR.value == 1
-        assert Rating.TWO_STARS.value == 2
-        assert Rating.THREE_STARS.value == 3
-        assert Rating.FOUR_STARS.value == 4
-        assert Rating.FIVE_STARS.value == 5
+    @pytest.mark.parametrize(("member", "expected"), [
+        (Rating.ONE_STAR, 1),
+        (Rating.TWO_STARS, 2),
+        (Rating.THREE_STARS, 3),
+        (Rating.FOUR_STARS, 4),
+        (Rating.FIVE_STARS, 5),
+    ])
+    def test_all_ratings_defined(self, member, expected):
+        assert member.value == expected
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,9 +2,17 @@
 Tests for Review System
 """
 
+import json
+
 import pytest
 
-from trustyclaw.sdk.review_system import DisputeResolution, ReviewStatus
+from trustyclaw.sdk.review_system import (
+    DisputeResolution,
+    Review,
+    ReviewService,
+    ReviewStatus,
+    get_review_service,
+)
 
 
 class TestReview:
@@ -12,8 +20,6 @@ class TestReview:
     
     def test_review_creation(self):
         """Test creating a basic review"""
-        from src.trustyclaw.sdk.review_system import Review, ReviewStatus
-        
         review = Review(
             review_id="test-review",
             provider="provider-addr",
@@ -32,8 +38,6 @@ class TestReview:
     
     def test_review_to_dict(self):
         """Test review serialization"""
-        from src.trustyclaw.sdk.review_system import Review
-        
         review = Review(
             review_id="test",
             provider="p",
@@ -52,13 +56,18 @@ class TestReview:
         assert data["status"] == "pending"
 
 
+@pytest.fixture(scope="module")
+def mock_service():
+    """Shared mock-data service for tests that only read from it"""
+    return ReviewService(mock=True)
+
+
 class TestReviewService:
     """Tests for ReviewService"""
     
     @pytest.fixture
     def service(self):
         """Create a fresh service with mock data"""
-        from src.trustyclaw.sdk.review_system import ReviewService
         return ReviewService(mock=True)
     
     def test_create_review(self, service):
@@ -75,7 +84,7 @@ class TestReviewService:
         
         assert review.review_id.startswith("review-")
         assert review.provider == "new-provider"
-        assert review.status.value == "pending"
+        assert review.status is ReviewStatus.PENDING
     
     def test_submit_review(self, service):
         """Test submitting a pending review"""
@@ -91,8 +100,25 @@ class TestReviewService:
         
         submitted = service.submit_review(review.review_id)
         
-        assert submitted.status.value == "submitted"
-        assert review.status.value == "submitted"
+        assert submitted.status is ReviewStatus.SUBMITTED
+        assert review.status is ReviewStatus.SUBMITTED
+    
+    def test_resubmit_review_lists_once(self, service):
+        """Test submitting a review twice does not duplicate it"""
+        review = service.create_review(
+            provider="resubmit-agent",
+            renter="renter",
+            skill_id="test",
+            rating=4,
+            completed_on_time=True,
+            output_quality="good",
+            comment="Good",
+        )
+        
+        service.submit_review(review.review_id)
+        service.submit_review(review.review_id)
+        
+        assert service.get_agent_reviews("resubmit-agent") == [review]
     
     def test_get_review(self, service):
         """Test retrieving a specific review"""
@@ -111,9 +137,9 @@ class TestReviewService:
         assert retrieved is not None
         assert retrieved.review_id == review.review_id
     
-    def test_get_agent_reviews(self, service):
+    def test_get_agent_reviews(self, mock_service):
         """Test getting reviews for an agent"""
-        reviews = service.get_agent_reviews(
+        reviews = mock_service.get_agent_reviews(
             "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
         )
         
@@ -121,6 +147,28 @@ class TestReviewService:
         for r in reviews:
             assert r.provider == "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
     
+    def test_get_agent_reviews_newest_first(self, service):
+        """Test reviews come back by created_at even when submitted out of order"""
+        older, newer = (
+            service.create_review(
+                provider="order-agent",
+                renter=renter,
+                skill_id="s",
+                rating=4,
+                completed_on_time=True,
+                output_quality="good",
+                comment="Ok",
+            )
+            for renter in ("r1", "r2")
+        )
+        older.created_at = "2026-01-01T00:00:00"
+        newer.created_at = "2026-01-02T00:00:00"
+        service.submit_review(newer.review_id)
+        service.submit_review(older.review_id)
+        
+        assert service.get_agent_reviews("order-agent") == [newer, older]
+        assert service.get_agent_reviews("order-agent", limit=1) == [newer]
+    
     def test_file_dispute(self, service):
         """Test filing a dispute"""
         review = service.create_review(
@@ -143,7 +191,8 @@ class TestReviewService:
         
         assert dispute.dispute_id.startswith("dispute-")
         assert dispute.reason == "Unfair rating"
-        assert review.status.value == "disputed"
+        assert review.status is ReviewStatus.DISPUTED
+        assert service.get_review_disputes(review.review_id) == [dispute]
     
     def test_resolve_dispute(self, service):
         """Test resolving a dispute"""
@@ -199,9 +248,9 @@ class TestReviewService:
         )
         service.submit_review(review.review_id)
         
-        service.vote_review(review.review_id, "v1", helpful=True)
-        service.vote_review(review.review_id, "v2", helpful=True)
-        service.vote_review(review.review_id, "v3", helpful=False)
+        vote = service.vote_review
+        for voter, helpful in [("v1", True), ("v2", True), ("v3", False)]:
+            vote(review.review_id, voter, helpful=helpful)
         
         votes = service.get_review_votes(review.review_id)
         
@@ -227,58 +276,148 @@ class TestReviewService:
         assert rating["average_rating"] == 5.0
         assert rating["rating"] == "excellent"
     
-    def test_calculate_agent_rating_insufficient_reviews(self, service):
+    def test_calculate_agent_rating_refreshes_after_submit(self, service):
+        """Test running totals pick up each newly submitted review"""
+        first = service.create_review(
+            provider="cached-agent",
+            renter="r1",
+            skill_id="s",
+            rating=5,
+            completed_on_time=True,
+            output_quality="excellent",
+            comment="Great",
+        )
+        service.submit_review(first.review_id)
+        assert service.calculate_agent_rating("cached-agent")["average_rating"] == 5.0
+        
+        second = service.create_review(
+            provider="cached-agent",
+            renter="r2",
+            skill_id="s",
+            rating=3,
+            completed_on_time=True,
+            output_quality="fair",
+            comment="Ok",
+        )
+        service.submit_review(second.review_id)
+        rating = service.calculate_agent_rating("cached-agent")
+        
+        assert rating["total_reviews"] == 2
+        assert rating["average_rating"] == 4.0
+    
+    def test_calculate_agent_rating_tracks_votes_and_disputes(self, service):
+        """Test running totals follow votes and drop disputed reviews"""
+        kept = service.create_review(
+            provider="agg-agent",
+            renter="r1",
+            skill_id="s",
+            rating=5,
+            completed_on_time=True,
+            output_quality="excellent",
+            comment="Great",
+        )
+        disputed = service.create_review(
+            provider="agg-agent",
+            renter="r2",
+            skill_id="s",
+            rating=1,
+            completed_on_time=False,
+            output_quality="poor",
+            comment="Bad",
+        )
+        service.submit_review(kept.review_id)
+        service.submit_review(disputed.review_id)
+        service.vote_review(kept.review_id, "v1", helpful=True)
+        service.vote_review(disputed.review_id, "v2", helpful=False)
+        assert service.calculate_agent_rating("agg-agent")["helpful_rate"] == 50.0
+
+        service.file_dispute(disputed.review_id, "agg-agent", "Unfair")
+        rating = service.calculate_agent_rating("agg-agent")
+
+        assert rating["total_reviews"] == 1
+        assert rating["average_rating"] == 5.0
+        assert rating["helpful_rate"] == 100.0
+        assert rating["quality_breakdown"] == {"excellent": 1, "good": 0, "fair": 0, "poor": 0}
+    
+    def test_quality_breakdown_drops_disputed_custom_quality(self, service):
+        """Test a non-standard quality leaves the breakdown once its review is disputed"""
+        for quality in ("excellent", "outstanding"):
+            review = service.create_review(
+                provider="quality-agent",
+                renter="r",
+                skill_id="s",
+                rating=5,
+                completed_on_time=True,
+                output_quality=quality,
+                comment="Great",
+            )
+            service.submit_review(review.review_id)
+        
+        service.file_dispute(review.review_id, "quality-agent", "Unfair")
+        breakdown = service.calculate_agent_rating("quality-agent")["quality_breakdown"]
+        
+        assert breakdown == {"excellent": 1, "good": 0, "fair": 0, "poor": 0}
+
+    def test_calculate_agent_rating_insufficient_reviews(self, mock_service):
         """Test rating for agent with no reviews"""
-        rating = service.calculate_agent_rating("unknown-agent", min_reviews=10)
+        rating = mock_service.calculate_agent_rating("unknown-agent", min_reviews=10)
         
         assert rating["rating"] == "insufficient_reviews"
         assert rating["total_reviews"] == 0
     
-    def test_get_top_agents(self, service):
+    def test_get_top_agents(self, mock_service):
         """Test getting top rated agents"""
-        top = service.get_top_agents(5)
+        top = mock_service.get_top_agents(5)
         
         assert len(top) <= 5
         # Should be sorted by rating
         for i in range(len(top) - 1):
             assert top[i]["average_rating"] >= top[i + 1]["average_rating"]
     
-    def test_export_reviews_json(self, service):
+    def test_export_reviews_json(self, mock_service):
         """Test exporting reviews as JSON"""
-        json_str = service.export_reviews_json()
+        json_str = mock_service.export_reviews_json()
         
-        import json
         data = json.loads(json_str)
         
         assert isinstance(data, list)
         assert len(data) > 0
+    
+    def test_export_reviews_json_matches_to_dict(self, mock_service):
+        """Test exported records have the same shape as Review.to_dict"""
+        agent = "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
+        data = json.loads(mock_service.export_reviews_json(agent))
+        
+        assert data == [r.to_dict() for r in mock_service.get_agent_reviews(agent)]
 
 
 class TestReviewStatus:
     """Tests for ReviewStatus enum"""
     
-    def test_all_statuses_exist(self):
+    @pytest.mark.parametrize(("member", "expected"), [
+        (ReviewStatus.PENDING, "pending"),
+        (ReviewStatus.SUBMITTED, "submitted"),
+        (ReviewStatus.DISPUTED, "disputed"),
+        (ReviewStatus.RESOLVED, "resolved"),
+        (ReviewStatus.ARCHIVED, "archived"),
+    ])
+    def test_all_statuses_exist(self, member, expected):
         """Test all expected statuses exist"""
-        from src.trustyclaw.sdk.review_system import ReviewStatus
-        
-        assert ReviewStatus.PENDING.value == "pending"
-        assert ReviewStatus.SUBMITTED.value == "submitted"
-        assert ReviewStatus.DISPUTED.value == "disputed"
-        assert ReviewStatus.RESOLVED.value == "resolved"
-        assert ReviewStatus.ARCHIVED.value == "archived"
+        assert member.value == expected
 
 
 class TestDisputeResolution:
     """Tests for DisputeResolution enum"""
     
-    def test_all_resolutions_exist(self):
+    @pytest.mark.parametrize(("member", "expected"), [
+        (DisputeResolution.APPROVED, "approved"),
+        (DisputeResolution.REJECTED, "rejected"),
+        (DisputeResolution.MODIFIED, "modified"),
+        (DisputeResolution.ESCALATED, "escalated"),
+    ])
+    def test_all_resolutions_exist(self, member, expected):
         """Test all resolution types exist"""
-        from src.trustyclaw.sdk.review_system import DisputeResolution
-        
-        assert DisputeResolution.APPROVED.value == "approved"
-        assert DisputeResolution.REJECTED.value == "rejected"
-        assert DisputeResolution.MODIFIED.value == "modified"
-        assert DisputeResolution.ESCALATED.value == "escalated"
+        assert member.value == expected
 
 
 class TestGetReviewService:
@@ -286,15 +425,11 @@ class TestGetReviewService:
     
     def test_get_service_mock(self):
         """Test getting service with mock data"""
-        from src.trustyclaw.sdk.review_system import get_review_service
-        
         service = get_review_service(mock=True)
         assert service.mock is True
     
     def test_get_service_no_mock(self):
         """Test getting service without mock data"""
-        from src.trustyclaw.sdk.review_system import get_review_service
-        
         service = get_review_service(mock=False)
         assert service.mock is False
 
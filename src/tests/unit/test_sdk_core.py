@@ -9,9 +9,13 @@ Usage:
     pytest src/tests/unit/test_sdk_core.py -v
 """
 
+import asyncio
+import copy
+
 import pytest
 from datetime import datetime
 
+from src.trustyclaw.sdk.client import SolanaClient
 from src.trustyclaw.sdk.identity import AgentIdentity, IdentityManager, IdentityStatus
 from src.trustyclaw.sdk.reputation import ReputationEngine, Review
 from src.trustyclaw.sdk.escrow import (
@@ -37,81 +41,61 @@ class TestAgentIdentity:
         assert identity.status == IdentityStatus.ACTIVE
         assert identity.reputation_score == 0.0
     
-    def test_identity_serialization(self, sample_identity):
+    def test_identity_serialization(self, sample_identity_dict):
         """Test serialization to dict"""
-        data = sample_identity.to_dict()
+        data = sample_identity_dict
         assert data["name"] == "TestAgent"
         assert data["wallet_address"] == "test-wallet-sol"
         assert "created_at" in data
         assert data["status"] == "active"
     
-    def test_identity_deserialization(self, sample_identity):
+    def test_identity_deserialization(self, sample_identity, sample_identity_dict):
         """Test deserialization from dict"""
-        data = sample_identity.to_dict()
-        restored = AgentIdentity.from_dict(data)
+        restored = AgentIdentity.from_dict(sample_identity_dict)
         assert restored.name == sample_identity.name
         assert restored.wallet_address == sample_identity.wallet_address
     
-    def test_update_reputation(self, sample_identity):
+    def test_update_reputation(self, sample_identity_mut):
         """Test reputation update"""
-        sample_identity.update_reputation(95.0)
-        assert sample_identity.reputation_score == 95.0
+        sample_identity_mut.update_reputation(95.0)
+        assert sample_identity_mut.reputation_score == 95.0
     
-    def test_increment_rentals(self, sample_identity):
+    def test_increment_rentals(self, sample_identity_mut):
         """Test rental count increment"""
-        initial = sample_identity.total_rentals
-        sample_identity.increment_rentals(completed=True)
-        assert sample_identity.total_rentals == initial + 1
-        assert sample_identity.completed_rentals == 10
+        initial = sample_identity_mut.total_rentals
+        sample_identity_mut.increment_rentals(completed=True)
+        assert sample_identity_mut.total_rentals == initial + 1
+        assert sample_identity_mut.completed_rentals == 10
 
 
 class TestIdentityManager:
     """Tests for IdentityManager"""
     
-    def test_register_identity(self, demo_identities):
+    def test_register_identity(self, manager):
         """Test registering identities"""
-        manager = IdentityManager()
-        for identity in demo_identities:
-            manager.register(identity)
         assert manager.check_exists("happyclaw.sol") is True
         assert manager.check_exists("alpha.sol") is True
         assert manager.check_exists("beta.sol") is True
     
-    def test_get_by_wallet(self, demo_identities):
+    def test_get_by_wallet(self, manager):
         """Test getting identity by wallet"""
-        manager = IdentityManager()
-        for identity in demo_identities:
-            manager.register(identity)
-        
         identity = manager.get_by_wallet("happyclaw.sol")
         assert identity is not None
         assert identity.name == "happyclaw-agent"
     
-    def test_get_by_name(self, demo_identities):
+    def test_get_by_name(self, manager):
         """Test getting identity by name"""
-        manager = IdentityManager()
-        for identity in demo_identities:
-            manager.register(identity)
-        
         identity = manager.get_by_name("agent-alpha")
         assert identity is not None
         assert identity.wallet_address == "alpha.sol"
     
-    def test_list_identities(self, demo_identities):
+    def test_list_identities(self, manager):
         """Test listing all identities"""
-        manager = IdentityManager()
-        for identity in demo_identities:
-            manager.register(identity)
-        
         identities = manager.list_identities()
         assert len(identities) == 3
     
-    def test_filter_by_reputation(self, demo_identities):
+    def test_filter_by_reputation(self, manager):
         """Test filtering by minimum reputation"""
-        manager = IdentityManager()
-        for identity in demo_identities:
-            manager.register(identity)
-        
         high_rep = manager.list_identities(min_reputation=90.0)
         assert len(high_rep) >= 1
         for identity in high_rep:
@@ -129,25 +113,27 @@ class TestReview:
         assert sample_review.rating == 5
         assert sample_review.validate() is True
     
-    def test_validate_invalid_rating(self):
-        """Test validation with invalid rating"""
-        review = Review(
-            provider="agent",
-            renter="other",
-            skill="test",
-            rating=0,  # Invalid
-        )
-        assert review.validate() is False
+    @pytest.mark.parametrize("rating,expected", [
+        (1, True),
+        (3, True),
+        (5, True),
+        (0, False),
+        (6, False),
+        (-1, False),
+    ])
+    def test_validate_rating_bounds(self, rating, expected):
+        """Test validation accepts only ratings 1-5"""
+        review = Review(provider="agent", renter="other", skill="test", rating=rating)
+        assert review.validate() is expected
     
-    def test_validate_missing_provider(self):
+    @pytest.mark.parametrize("provider,expected", [
+        ("agent", True),
+        ("", False),
+    ])
+    def test_validate_required_fields(self, provider, expected):
         """Test validation with missing provider"""
-        review = Review(
-            provider="",
-            renter="other",
-            skill="test",
-            rating=5,
-        )
-        assert review.validate() is False
+        review = Review(provider=provider, renter="other", skill="test", rating=5)
+        assert review.validate() is expected
 
 
 class TestReputationEngine:
@@ -236,6 +222,46 @@ class TestReputationEngine:
         assert len(reviews) == 1
         assert reviews[0].comment == "Great!"
 
+    def test_add_review_after_replace(self):
+        """Test averages stay correct on a copied score"""
+        from dataclasses import replace
+
+        engine = ReputationEngine()
+        review = Review(provider="a", renter="r", skill="s", rating=5, completed_on_time=True)
+        score = engine.add_review("a", review)
+        engine._scores["a"] = replace(score, reviews=list(score.reviews))
+
+        score = engine.add_review("a", review)
+        assert score.average_rating == 5.0
+        assert score.on_time_percentage == 100.0
+
+
+# ============ Client Tests ============
+
+RPC_RESULTS = {
+    "getBalance": {"value": 1_000_000_000},
+    "getAccountInfo": {"value": {"lamports": 1_000_000_000, "owner": "11111111111111111111111111111111"}},
+    "getLatestBlockhash": {"value": {"blockhash": "test-blockhash-123"}},
+    "sendTransaction": "tx-abc123",
+}
+
+
+class TestSolanaClient:
+    """Tests for SolanaClient with the JSON-RPC boundary stubbed"""
+    
+    @pytest.mark.parametrize("method,args,rpc_method,expected", [
+        ("get_balance", ("addr",), "getBalance", 1_000_000_000),
+        ("get_account_info", ("addr",), "getAccountInfo",
+         RPC_RESULTS["getAccountInfo"]["value"]),
+        ("get_latest_blockhash", (), "getLatestBlockhash", "test-blockhash-123"),
+        ("send_transaction", (b"tx", ["sig"]), "sendTransaction", "tx-abc123"),
+    ])
+    def test_rpc_method(self, rpc_stub, method, args, rpc_method, expected):
+        """Test each RPC wrapper unpacks its result"""
+        client = SolanaClient()
+        assert asyncio.run(getattr(client, method)(*args)) == expected
+        assert rpc_stub[-1][0] == rpc_method
+
 
 # ============ Escrow Tests ============
 
@@ -360,9 +386,9 @@ class TestEscrowClient:
 
 # ============ Pytest Fixtures ============
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_identity():
-    """Create a sample identity for testing"""
+    """Create a sample identity for testing (shared; do not mutate)"""
     return AgentIdentity(
         id="test-agent-001",
         name="TestAgent",
@@ -376,7 +402,19 @@ def sample_identity():
     )
 
 
+@pytest.fixture(scope="session")
+def sample_identity_dict(sample_identity):
+    """Serialized form of the sample identity (shared; do not mutate)"""
+    return sample_identity.to_dict()
+
+
 @pytest.fixture
+def sample_identity_mut(sample_identity):
+    """Private copy of the sample identity for tests that mutate it"""
+    return copy.deepcopy(sample_identity)
+
+
+@pytest.fixture(scope="session")
 def sample_review():
     """Create a sample review for testing"""
     return Review(
@@ -390,10 +428,10 @@ def sample_review():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def demo_identities():
     """Create demo identities for testing"""
-    return [
+    return (
         AgentIdentity(
             name="happyclaw-agent",
             wallet_address="happyclaw.sol",
@@ -418,7 +456,29 @@ def demo_identities():
             total_rentals=28,
             completed_rentals=27,
         ),
-    ]
+    )
+
+
+@pytest.fixture(scope="class")
+def manager(demo_identities):
+    """IdentityManager with the demo identities registered once per class"""
+    manager = IdentityManager()
+    for identity in demo_identities:
+        manager.register(identity)
+    return manager
+
+
+@pytest.fixture
+def rpc_stub(monkeypatch):
+    """Stub SolanaClient._rpc with canned results; returns the call log"""
+    calls = []
+    
+    async def fake_rpc(self, method, params):
+        calls.append((method, params))
+        return RPC_RESULTS[method]
+    
+    monkeypatch.setattr(SolanaClient, "_rpc", fake_rpc)
+    return calls
 
 
 # ============ Run Tests ============
@@ -5,30 +5,35 @@ Uses trustyclaw.sdk.usdc (PYTHONPATH=src). When client has no RPC (HAS_SOLANA Fa
 get_balance returns 0.0 and find_associated_token_account returns None.
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from trustyclaw.sdk.usdc import (
+    TokenAccount,
+    TokenError,
+    TransferResult,
+    TransferStatus,
+    USDCClient,
+    get_usdc_client,
+)
 
-class TestUSDCClient:
-    """Tests for USDC token client"""
 
-    @pytest.fixture
-    def client(self):
-        """Create client; patch so no Solana RPC (client is None)."""
-        with patch("trustyclaw.sdk.usdc.HAS_SOLANA", False):
-            from trustyclaw.sdk.usdc import USDCClient
-            return USDCClient(network="devnet")
+@pytest.fixture(scope="module")
+def client():
+    """Create client once; patch so no Solana RPC (client is None)."""
+    with patch("trustyclaw.sdk.usdc.HAS_SOLANA", False):
+        return USDCClient(network="devnet")
 
-    @pytest.fixture
-    def usdc_client_class(self):
-        """Import USDCClient for assertions that need the class."""
-        from trustyclaw.sdk.usdc import USDCClient
-        return USDCClient
 
-    def test_init(self, client, usdc_client_class):
+class TestUSDCClient:
+    """Tests for USDC token client"""
+
+    def test_init(self, client):
         """Test client initialization"""
         assert client.network == "devnet"
-        assert client.mint == usdc_client_class.DEVNET_MINT
+        assert client.mint == USDCClient.DEVNET_MINT
         assert client._keypair is None
 
     def test_address_property_no_keypair(self, client):
@@ -41,6 +46,44 @@ class TestUSDCClient:
         assert client.get_balance("3WaHbF7k9ced4d2wA8caUHq2v57ujD4J2c57L8wZXfhN") == 0.0
         assert client.get_balance("unknown-wallet") == 0.0
 
+    def test_get_balances_no_rpc(self, client):
+        """When no RPC client, get_balances reports 0.0 for every wallet"""
+        assert client.get_balances(["wallet-a", "wallet-b"]) == {"wallet-a": 0.0, "wallet-b": 0.0}
+
+    def test_get_balances_single_batch(self):
+        """Balances for many wallets come from one getMultipleAccounts call"""
+        funded = "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
+        empty = "3WaHbF7k9ced4d2wA8caUHq2v57ujD4J2c57L8wZXfhN"
+        token_account = SimpleNamespace(
+            data=SimpleNamespace(parsed={"info": {"tokenAmount": {"uiAmount": 2.5}}})
+        )
+        rpc = Mock()
+        rpc.get_multiple_accounts_json_parsed.return_value = SimpleNamespace(
+            value=[token_account, None]
+        )
+        usdc = USDCClient(network="devnet")
+        usdc.client = rpc
+
+        balances = usdc.get_balances([funded, empty, "unknown-wallet"])
+
+        assert balances == {funded: 2.5, empty: 0.0, "unknown-wallet": 0.0}
+        rpc.get_multiple_accounts_json_parsed.assert_called_once()
+
+    def test_get_balance_matches_get_balances(self):
+        """Single and batched lookups resolve a wallet's balance the same way"""
+        wallet = "GFeyFZLmvsw7aKHNoUUM84tCvgKf34ojbpKeKcuXDE5q"
+        token_account = SimpleNamespace(
+            data=SimpleNamespace(parsed={"info": {"tokenAmount": {"uiAmount": 7.25}}})
+        )
+        rpc = Mock()
+        rpc.get_multiple_accounts_json_parsed.return_value = SimpleNamespace(
+            value=[token_account]
+        )
+        usdc = USDCClient(network="devnet")
+        usdc.client = rpc
+
+        assert usdc.get_balance(wallet) == usdc.get_balances([wallet])[wallet] == 7.25
+
     def test_find_associated_token_account_no_rpc(self, client):
         """When no RPC client, find_associated_token_account returns None"""
         account = client.find_associated_token_account(
@@ -55,7 +98,7 @@ class TestUSDCClient:
             to_wallet="HajVDaadfi6vxrt7y6SRZWBHVYCTscCc8Cwurbqbmg5B",
             amount=10.0,
         )
-        assert result.status.value == "confirmed"
+        assert result.status is TransferStatus.CONFIRMED
         assert result.amount == 10.0
         assert result.token == "USDC"
         assert "transfer-" in result.signature
@@ -65,17 +108,16 @@ class TestUSDCClient:
         """Test USDC decimals"""
         assert client.decimals() == 6
 
-    def test_amount_to_raw(self, client):
-        """Test amount to raw conversion"""
-        assert client.amount_to_raw(1.0) == 1_000_000
-        assert client.amount_to_raw(0.01) == 10_000
-        assert client.amount_to_raw(100.0) == 100_000_000
-
-    def test_raw_to_amount(self, client):
-        """Test raw to amount conversion"""
-        assert client.raw_to_amount(1_000_000) == 1.0
-        assert client.raw_to_amount(10_000) == 0.01
-        assert client.raw_to_amount(100_000_000) == 100.0
+    @pytest.mark.parametrize("amount,raw", [
+        (1.0, 1_000_000),
+        (0.01, 10_000),
+        (100.0, 100_000_000),
+        (0.000249, 249),
+    ])
+    def test_amount_conversion(self, client, amount, raw):
+        """Test amount <-> raw conversion in both directions"""
+        assert client.amount_to_raw(amount) == raw
+        assert client.raw_to_amount(raw) == amount
 
 
 class TestTransferResult:
@@ -83,8 +125,6 @@ class TestTransferResult:
 
     def test_explorer_url(self):
         """Test explorer URL generation"""
-        from trustyclaw.sdk.usdc import TransferResult, TransferStatus
-
         result = TransferResult(
             signature="5hJ7Xg8Yz3N7JW6Z7Z2V4K8Y9Q1M2N3O4P5Q6R7S8T",
             status=TransferStatus.CONFIRMED,
@@ -98,8 +138,6 @@ class TestTransferResult:
 
     def test_default_token(self):
         """Test default token is USDC"""
-        from trustyclaw.sdk.usdc import TransferResult, TransferStatus
-
         result = TransferResult(
             signature="test",
             status=TransferStatus.PENDING,
@@ -115,8 +153,6 @@ class TestTokenAccount:
 
     def test_balance_raw(self):
         """Test raw balance calculation"""
-        from trustyclaw.sdk.usdc import TokenAccount
-
         account = TokenAccount(
             address="test-account",
             mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
@@ -132,15 +168,11 @@ class TestGetUSDCClient:
 
     def test_get_client_devnet(self):
         """Test getting devnet client"""
-        from trustyclaw.sdk.usdc import get_usdc_client
-
         client = get_usdc_client("devnet")
         assert client.network == "devnet"
 
     def test_get_client_mainnet(self):
         """Test getting mainnet client"""
-        from trustyclaw.sdk.usdc import get_usdc_client, USDCClient
-
         client = get_usdc_client("mainnet")
         assert client.network == "mainnet"
         assert client.mint == USDCClient.MAINNET_MINT
@@ -150,15 +182,6 @@ class TestTokenError:
     """Tests for TokenError"""
 
     def test_raise_error(self):
-        """Test raising token error"""
-        from trustyclaw.sdk.usdc import TokenError
-
-        with pytest.raises(TokenError):
-            raise TokenError("Test error message")
-
-    def test_error_message(self):
-        """Test error message"""
-        from trustyclaw.sdk.usdc import TokenError
-
-        error = TokenError("Insufficient funds")
-        assert "Insufficient funds" in str(error)
+        """Test raising token error carries its message"""
+        with pytest.raises(TokenError, match="Insufficient funds"):
+            raise TokenError("Insufficient funds")
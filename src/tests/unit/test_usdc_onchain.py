@@ -5,10 +5,11 @@ Real SPL Token operations tests on Solana devnet.
 These tests perform actual blockchain transactions.
 """
 
-import pytest
+import base64
+import json
 import os
-from unittest.mock import patch
-import time
+
+import pytest
 
 
 class TestUSDCOnChain:
@@ -188,7 +189,24 @@ class TestKeypairManager:
         address = manager.load_keypair(str(keypair_path), name="test")
         assert address == str(test_keypair.pubkey())
         assert len(manager.list_wallets()) == 1
-    
+
+    @pytest.mark.parametrize("encode", [
+        lambda secret: secret,
+        lambda secret: base64.b64encode(secret) + b"\n",
+        lambda secret: json.dumps(list(secret)).encode(),
+    ], ids=["raw", "base64", "json-array"])
+    def test_load_keypair_formats(self, tmp_path, encode):
+        """Test raw, base64 and JSON-array keypair files all load"""
+        from trustyclaw.sdk.keypair import KeypairManager
+        from solders.keypair import Keypair
+
+        test_keypair = Keypair()
+        keypair_path = tmp_path / "keypair"
+        keypair_path.write_bytes(encode(bytes(test_keypair)))
+
+        manager = KeypairManager()
+        assert manager.load_keypair(str(keypair_path)) == str(test_keypair.pubkey())
+
     def test_list_wallets(self, tmp_path):
         """Test listing loaded wallets"""
         import json
@@ -2,39 +2,51 @@
 Tests for USDC Payment Service (simplified)
 """
 
+import json
+from dataclasses import replace
+from unittest.mock import Mock
+
 import pytest
 
+from trustyclaw.sdk.usdc_payment import (
+    EscrowPayment,
+    PaymentIntent,
+    USDCPaymentService,
+    get_usdc_payment_service,
+)
+
+# Shared read-only instances; tests that need other values use replace()
+INTENT = PaymentIntent(
+    intent_id="pi-test-1",
+    from_wallet="wallet-1",
+    to_wallet="wallet-2",
+    amount=1_000_000,
+    description="Test payment",
+)
+ESCROW_PAYMENT = EscrowPayment(
+    escrow_id="escrow-1",
+    payment_intent_id="pi-1",
+    amount=1_000_000,
+    from_wallet="renter",
+    to_wallet="provider",
+)
+
 
 class TestPaymentIntent:
     """Tests for PaymentIntent dataclass"""
     
-    def test_amount_usd_property(self):
+    @pytest.mark.parametrize("amount,expected", [
+        (1_000_000, 1.0),
+        (500_000, 0.5),
+        (0, 0.0),
+    ])
+    def test_amount_usd_property(self, amount, expected):
         """Test amount USD conversion"""
-        from trustyclaw.sdk.usdc_payment import PaymentIntent, PaymentStatus
-        
-        intent = PaymentIntent(
-            intent_id="pi-test-1",
-            from_wallet="wallet-1",
-            to_wallet="wallet-2",
-            amount=1_000_000,
-            description="Test payment",
-        )
-        
-        assert intent.amount_usd == 1.0
+        assert replace(INTENT, amount=amount).amount_usd == expected
     
     def test_to_dict(self):
         """Test intent to dictionary conversion"""
-        from trustyclaw.sdk.usdc_payment import PaymentIntent
-        
-        intent = PaymentIntent(
-            intent_id="pi-test-1",
-            from_wallet="wallet-1",
-            to_wallet="wallet-2",
-            amount=500_000,
-            description="Test payment",
-        )
-        
-        result = intent.to_dict()
+        result = INTENT.to_dict()
         
         assert result["intent_id"] == "pi-test-1"
 
@@ -42,35 +54,151 @@ class TestPaymentIntent:
 class TestEscrowPayment:
     """Tests for EscrowPayment dataclass"""
     
-    def test_amount_usd_property(self):
+    @pytest.mark.parametrize("amount,expected", [
+        (2_000_000, 2.0),
+        (10_000, 0.01),
+    ])
+    def test_amount_usd_property(self, amount, expected):
         """Test amount USD conversion"""
-        from trustyclaw.sdk.usdc_payment import EscrowPayment
-        
-        payment = EscrowPayment(
-            escrow_id="escrow-1",
-            payment_intent_id="pi-1",
-            amount=2_000_000,
-            from_wallet="renter",
-            to_wallet="provider",
-        )
-        
-        assert payment.amount_usd == 2.0
+        assert replace(ESCROW_PAYMENT, amount=amount).amount_usd == expected
     
     def test_to_dict(self):
         """Test payment to dictionary conversion"""
-        from trustyclaw.sdk.usdc_payment import EscrowPayment
-        
-        payment = EscrowPayment(
-            escrow_id="escrow-1",
-            payment_intent_id="pi-1",
-            amount=1_000_000,
-            from_wallet="renter",
-            to_wallet="provider",
+        result = ESCROW_PAYMENT.to_dict()
+        
+        assert result["escrow_id"] == "escrow-1"
+
+
+class TestUSDCPaymentService:
+    """Tests for USDCPaymentService"""
+    
+    @pytest.fixture
+    def service(self):
+        """Create a service backed by a stub USDC client"""
+        return USDCPaymentService(usdc_client=Mock())
+    
+    def test_check_all_balances_and_notify(self, service):
+        """Test all registered wallets are checked with one batched lookup"""
+        service.register_balance_notification("low-wallet", threshold_usd=10.0)
+        service.register_balance_notification("rich-wallet", threshold_usd=10.0)
+        service.usdc_client.get_balances.return_value = {
+            "low-wallet": 1.0,
+            "rich-wallet": 50.0,
+        }
+        
+        results = service.check_all_balances_and_notify()
+        
+        service.usdc_client.get_balances.assert_called_once_with(["low-wallet", "rich-wallet"])
+        service.usdc_client.get_balance.assert_not_called()
+        assert results["low-wallet"]["alert_sent"] is True
+        assert results["rich-wallet"]["reason"] == "Balance above threshold"
+    
+    def test_balance_reads_cached_until_payment(self, service):
+        """Test repeated checks reuse a balance until a payment touches the wallet"""
+        service.register_balance_notification("wallet-1", threshold_usd=10.0)
+        service.usdc_client.get_balance.return_value = 50.0
+        
+        service.check_balance_and_notify("wallet-1")
+        service.check_balance_and_notify("wallet-1")
+        assert service.usdc_client.get_balance.call_count == 1
+        
+        intent = service.create_payment_intent(1_000_000, "wallet-1", "wallet-2", "Test")
+        assert service.execute_payment_intent(intent.intent_id).success
+        service.check_balance_and_notify("wallet-1")
+        assert service.usdc_client.get_balance.call_count == 2
+    
+    def test_get_payment_history_newest_first(self, service):
+        """Test history lists a wallet's payments by creation, newest first"""
+        older = service.create_payment_intent(1_000_000, "wallet-1", "wallet-2", "Older")
+        newer = service.create_payment_intent(2_000_000, "wallet-3", "wallet-1", "Newer")
+        unrelated = service.create_payment_intent(3_000_000, "wallet-2", "wallet-3", "Other")
+        older.created_at = "2026-01-01T00:00:00"
+        newer.created_at = "2026-01-02T00:00:00"
+        for intent in (newer, unrelated, older):
+            service.execute_payment_intent(intent.intent_id)
+        
+        history = service.get_payment_history("wallet-1")
+        
+        assert [p.description for p in history] == ["Newer", "Older"]
+        assert service.get_payment_history("wallet-1", limit=1)[0].description == "Newer"
+    
+    def test_export_payments_json(self, service):
+        """Test exported payments round-trip through JSON as to_dict records"""
+        service.usdc_client.transfer.return_value.signature = "sig-1"
+        intent = service.create_payment_intent(1_500_000, "wallet-1", "wallet-2", "Export")
+        service.execute_payment_intent(intent.intent_id)
+        
+        data = json.loads(service.export_payments_json("wallet-1"))
+        
+        assert data == [p.to_dict() for p in service.get_payment_history("wallet-1")]
+        assert data[0]["amount_usd"] == 1.5
+    
+    @pytest.mark.parametrize("amount,requires_multisig", [
+        (999_999_999, False),
+        (1_000_000_000, True),
+    ])
+    def test_multisig_threshold(self, service, amount, requires_multisig):
+        """Test intents at or above the multisig threshold are flagged"""
+        intent = service.create_payment_intent(amount, "wallet-1", "wallet-2", "Large")
+        
+        assert intent.metadata.get("requires_multisig", False) is requires_multisig
+    
+    @pytest.mark.parametrize("max_daily,expected_reloads", [
+        (0, 1),
+        (2, 2),
+    ])
+    def test_auto_reload_daily_limit(self, service, max_daily, expected_reloads):
+        """Test auto-reload honours auto_reload_max_daily, defaulting to once a day"""
+        notification = service.register_balance_notification(
+            "wallet-1", threshold_usd=10.0, auto_reload=True
         )
+        notification.auto_reload_max_daily = max_daily
+        service.usdc_client.get_balance.return_value = 1.0
         
-        result = payment.to_dict()
+        for _ in range(3):
+            service.check_balance_and_notify("wallet-1", force=True)
         
-        assert result["escrow_id"] == "escrow-1"
+        assert notification.reload_count_today == expected_reloads
+    
+    def test_collect_multisig_signature(self, service):
+        """Test signatures accumulate until the required count is met"""
+        service.multisig_config.required_signers.extend(["signer-1", "signer-2"])
+        intent = service.create_payment_intent(1_000_000_000, "wallet-1", "wallet-2", "Large")
+        
+        first = service.collect_multisig_signature(intent.intent_id, "signer-1", "sig-1")
+        second = service.collect_multisig_signature(intent.intent_id, "signer-2", "sig-2")
+        
+        assert first["signatures_needed"] == 1
+        assert second["multisig_complete"] is True
+        assert intent.metadata["signatures_collected"] == {"signer-1": "sig-1", "signer-2": "sig-2"}
+    
+    def test_default_client_shares_rpc_per_network(self):
+        """Test each service owns its USDC client but shares the network's RPC client"""
+        devnet = get_usdc_payment_service("devnet")
+        other = USDCPaymentService(network="devnet")
+        
+        assert other.usdc_client is not devnet.usdc_client
+        assert other.usdc_client.client is devnet.usdc_client.client
+        assert get_usdc_payment_service("mainnet").usdc_client.client is not devnet.usdc_client.client
+    
+    def test_callback_added_during_alert_waits_for_next_alert(self, service):
+        """Test a callback registered mid-dispatch is not run for the current alert"""
+        calls = []
+        
+        def late(alert):
+            calls.append("late")
+        
+        def first(alert):
+            calls.append("first")
+            service.add_notification_callback(late)
+        
+        service.add_notification_callback(first)
+        service.register_balance_notification("wallet-1", threshold_usd=10.0)
+        service.usdc_client.get_balance.return_value = 1.0
+        
+        service.check_balance_and_notify("wallet-1")
+        
+        assert calls == ["first"]
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ from .solana import (
     TransactionInfo,
     Network,
     get_client,
+    get_rpc_client,
 )
 from .usdc import (
     USDCClient,
@@ -89,6 +90,7 @@ __all__ = [
     "TransactionInfo", 
     "Network",
     "get_client",
+    "get_rpc_client",
     # USDC
     "USDCClient",
     "TokenAccount",
@@ -23,6 +23,7 @@ from typing import Callable, Dict, List, Optional
 import threading
 import time
 import hashlib
+import hmac
 import json
 
 
@@ -403,8 +404,8 @@ class AutoExecutor:
         Returns:
             True if hash matches
         """
-        actual_hash = hashlib.sha256(deliverable_content.encode()).hexdigest()
-        return actual_hash == expected_hash
+        actual_hash = self.calculate_deliverable_hash(deliverable_content)
+        return hmac.compare_digest(actual_hash.encode(), expected_hash.encode())
     
     def calculate_deliverable_hash(self, content: str) -> str:
         """
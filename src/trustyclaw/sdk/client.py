@@ -95,18 +95,19 @@ class SolanaClient:
         
         self.commitment = self.config.commitment
     
-    async def get_balance(self, address: str) -> int:
+    async def _rpc(self, method: str, params: list) -> Any:
         """
-        Get the balance of a Solana address in lamports.
+        Make a JSON-RPC call and return its "result" member.
         
         Args:
-            address: Base58 encoded public key
+            method: RPC method name
+            params: RPC params list
             
         Returns:
-            Balance in lamports (1 SOL = 1e9 lamports)
+            The decoded "result" value
             
         Raises:
-            ConnectionError: If RPC call fails
+            RuntimeError: If the RPC response contains an error
         """
         import httpx
         
@@ -116,15 +117,31 @@ class SolanaClient:
                 json={
                     "jsonrpc": "2.0",
                     "id": 1,
-                    "method": "getBalance",
-                    "params": [address],
+                    "method": method,
+                    "params": params,
                 },
             )
             response.raise_for_status()
             result = response.json()
             if "error" in result:
                 raise RuntimeError(f"RPC error: {result['error']}")
-            return result["result"]["value"]
+            return result["result"]
+    
+    async def get_balance(self, address: str) -> int:
+        """
+        Get the balance of a Solana address in lamports.
+        
+        Args:
+            address: Base58 encoded public key
+            
+        Returns:
+            Balance in lamports (1 SOL = 1e9 lamports)
+            
+        Raises:
+            ConnectionError: If RPC call fails
+        """
+        result = await self._rpc("getBalance", [address])
+        return result["value"]
     
     async def get_account_info(self, address: str) -> Optional[dict]:
         """
@@ -139,23 +156,8 @@ class SolanaClient:
         Raises:
             ConnectionError: If RPC call fails
         """
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getAccountInfo",
-                    "params": [address, {"commitment": self.commitment}],
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                raise RuntimeError(f"RPC error: {result['error']}")
-            return result["result"]["value"]
+        result = await self._rpc("getAccountInfo", [address, {"commitment": self.commitment}])
+        return result["value"]
     
     async def get_latest_blockhash(self) -> str:
         """
@@ -167,23 +169,8 @@ class SolanaClient:
         Raises:
             ConnectionError: If RPC call fails
         """
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getLatestBlockhash",
-                    "params": [{"commitment": self.commitment}],
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                raise RuntimeError(f"RPC error: {result['error']}")
-            return result["result"]["value"]["blockhash"]
+        result = await self._rpc("getLatestBlockhash", [{"commitment": self.commitment}])
+        return result["value"]["blockhash"]
     
     async def send_transaction(
         self,
@@ -204,29 +191,17 @@ class SolanaClient:
             ConnectionError: If RPC call fails
         """
         import base64
-        import httpx
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "sendTransaction",
-                    "params": [
-                        base64.b64encode(transaction).decode(),
-                        {
-                            "encoding": "base64",
-                            "commitment": self.commitment,
-                        },
-                    ],
+        return await self._rpc(
+            "sendTransaction",
+            [
+                base64.b64encode(transaction).decode(),
+                {
+                    "encoding": "base64",
+                    "commitment": self.commitment,
                 },
-            )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                raise RuntimeError(f"RPC error: {result['error']}")
-            return result["result"]
+            ],
+        )
     
     async def get_token_balance(
         self,
@@ -243,23 +218,11 @@ class SolanaClient:
         Returns:
             Token balance in raw units (not decimals)
         """
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getTokenAccountBalance",
-                    "params": [token_account, {"commitment": self.commitment}],
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                raise RuntimeError(f"RPC error: {result['error']}")
-            return int(result["result"]["value"]["amount"])
+        result = await self._rpc(
+            "getTokenAccountBalance",
+            [token_account, {"commitment": self.commitment}],
+        )
+        return int(result["value"]["amount"])
     
     async def get_token_accounts_by_owner(
         self,
@@ -276,27 +239,12 @@ class SolanaClient:
         Returns:
             List of token account dicts
         """
-        import httpx
+        params = [{"commitment": self.commitment}]
+        if mint:
+            params.append({"mint": mint})
         
-        async with httpx.AsyncClient() as client:
-            params = [{"commitment": self.commitment}]
-            if mint:
-                params.append({"mint": mint})
-            
-            response = await client.post(
-                self.rpc_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getTokenAccountsByOwner",
-                    "params": [owner] + params,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            if "error" in result:
-                raise RuntimeError(f"RPC error: {result['error']}")
-            return result["result"]["value"]
+        result = await self._rpc("getTokenAccountsByOwner", [owner] + params)
+        return result["value"]
     
     def derive_pda(
         self,
@@ -181,8 +181,9 @@ class EscrowClient:
         """
         import hashlib
         
-        # Generate PDA address
-        seed = f"escrow-{provider}-{datetime.utcnow().isoformat()}"
+        # Generate PDA address (one clock read shared with created_at)
+        now = datetime.utcnow().isoformat()
+        seed = f"escrow-{provider}-{now}"
         address = hashlib.sha256(seed.encode()).hexdigest()[:32]
         
         # Create escrow state
@@ -193,7 +194,7 @@ class EscrowClient:
             terms=terms,
             state=EscrowState.CREATED,
             amount=0,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=now,
         )
         self._escrows[address] = escrow
         
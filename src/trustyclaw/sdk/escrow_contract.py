@@ -5,11 +5,13 @@ Secure USDC escrow for agent skill rentals using Anchor CPI.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
 from enum import Enum
 import json
 import os
+import time
 
 # Try to import Anchor/PyUSD dependencies
 try:
@@ -26,6 +28,16 @@ try:
 except ImportError:
     HAS_ANCHOR = False
 
+from .usdc_payment import (
+    BalanceNotification,
+    EscrowPayment,
+    MultisigConfig,
+    Payment,
+    PaymentIntent,
+    PaymentResult,
+    USDCPaymentService,
+)
+
 
 class EscrowState(Enum):
     """Escrow lifecycle state"""
@@ -41,7 +53,7 @@ class EscrowError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowTerms:
     """Terms of the escrow agreement"""
     skill_name: str
@@ -50,7 +62,7 @@ class EscrowTerms:
     metadata_uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowData:
     """On-chain escrow account data"""
     provider: str
@@ -98,11 +110,11 @@ class EscrowState(Enum):
     COMPLETED = "completed"
     RELEASED = "released"
 
-@dataclass
+@dataclass(slots=True)
 class SimpleTerms:
     amount: int
 
-@dataclass
+@dataclass(slots=True)
 class EscrowResult:
     escrow_id: str
     state: EscrowState
@@ -650,9 +662,9 @@ class EscrowClient:
             return result.value.err is None
         except:
             return False
-
-
-# Helper function to get client
+    
+    # ============ Simulation Operations ============
+    
     def create_escrow(self, renter: str, provider: str, skill_id: str, amount: int, duration_hours: int, deliverable_hash: str) -> EscrowResult:
         '''Create escrow (graceful simulation if no real tx possible)'''
         print("[SIMULATION] Creating escrow - set SOLANA_KEYPAIR_PATH for real on-chain")
@@ -721,98 +733,21 @@ class EscrowClient:
         if escrow_id not in self._escrows:
             return 0
         return self._escrows[escrow_id]['amount']
-
-    def create_escrow(self, renter: str, provider: str, skill_id: str, amount: int, duration_hours: int, deliverable_hash: str) -> 'EscrowResult':
-        '''Create escrow (graceful simulation if no real tx possible)'''
-        print('[SIMULATION] Creating escrow - set SOLANA_KEYPAIR_PATH for real on-chain')
-        escrow_id = f'escrow_{provider[:8]}_{skill_id}_{hash(deliverable_hash) % 10000}'
-        self._escrows[escrow_id] = {
-            'state': 'created',
-            'amount': amount,
-        }
-        return EscrowResult(
-            escrow_id=escrow_id,
-            state=EscrowState.CREATED,
-            terms=SimpleTerms(amount=amount)
-        )
-
-    def fund_escrow(self, escrow_id: str) -> 'EscrowResult':
-        '''Fund escrow (graceful simulation)'''
-        print('[SIMULATION] Funding escrow')
-        if escrow_id not in self._escrows:
-            raise ValueError(f'Escrow {escrow_id} not found')
-        self._escrows[escrow_id]['state'] = 'funded'
-        return EscrowResult(
-            escrow_id=escrow_id,
-            state=EscrowState.FUNDED,
-            terms=SimpleTerms(amount=self._escrows[escrow_id]['amount'])
-        )
-
-    def activate_escrow(self, escrow_id: str) -> 'EscrowResult':
-        '''Activate escrow after funding (simulation)'''
-        print('[SIMULATION] Activating escrow')
-        if escrow_id not in self._escrows or self._escrows[escrow_id]['state'] != 'funded':
-            raise ValueError('Cannot activate unfunded escrow')
-        self._escrows[escrow_id]['state'] = 'active'
-        return EscrowResult(
-            escrow_id=escrow_id,
-            state=EscrowState.ACTIVE,
-            terms=SimpleTerms(amount=self._escrows[escrow_id]['amount'])
-        )
-
-    def complete_escrow(self, escrow_id: str, deliverable_hash: str) -> 'EscrowResult':
-        '''Complete escrow with deliverable (simulation)'''
-        print('[SIMULATION] Completing escrow')
-        if escrow_id not in self._escrows or self._escrows[escrow_id]['state'] != 'active':
-            raise ValueError('Cannot complete inactive escrow')
-        self._escrows[escrow_id]['state'] = 'completed'
-        self._escrows[escrow_id]['deliverable_hash'] = deliverable_hash
-        return EscrowResult(
-            escrow_id=escrow_id,
-            state=EscrowState.COMPLETED,
-            terms=SimpleTerms(amount=self._escrows[escrow_id]['amount'])
-        )
-
-    def release_escrow(self, escrow_id: str) -> 'EscrowResult':
-        '''Release funds (simulation)'''
-        print('[SIMULATION] Releasing escrow funds')
-        if escrow_id not in self._escrows or self._escrows[escrow_id]['state'] != 'completed':
-            raise ValueError('Cannot release uncompleted escrow')
-        self._escrows[escrow_id]['state'] = 'released'
-        return EscrowResult(
-            escrow_id=escrow_id,
-            state=EscrowState.RELEASED,
-            terms=SimpleTerms(amount=self._escrows[escrow_id]['amount'])
-        )
-
-    def release_amount_for_escrow(self, escrow_id: str) -> int:
-        '''Get release amount for escrow'''
-        if escrow_id not in self._escrows:
-            return 0
-        return self._escrows[escrow_id]['amount']
-
-def get_escrow_client(
-    program_id: Optional[str] = None,
-    network: str = "devnet",
-) -> EscrowClient:
-    """
-    Get an EscrowClient instance.
     
-    Args:
-        program_id: Optional program ID override
-        network: Network name
+    # ============ USDC Payment Service Integration ============
+    
+    @cached_property
+    def payment_service(self) -> 'USDCPaymentService':
+        """
+        USDC Payment Service for this escrow.
         
-    Returns:
-        Configured EscrowClient
-    """
-    return EscrowClient(
-        program_id=program_id,
-        network=network,
-    )
-
-
-# ============ USDC Payment Service Integration ============
-
+        Created on first access and cached on the instance.
+        """
+        return USDCPaymentService(
+            network=self.network,
+            usdc_client=None,
+        )
+    
     def get_payment_service(self) -> 'USDCPaymentService':
         """
         Get the USDC Payment Service for this escrow.
@@ -822,13 +757,7 @@ def get_escrow_client(
         Returns:
             USDCPaymentService instance
         """
-        if not hasattr(self, '_payment_service'):
-            from .usdc_payment import USDCPaymentService
-            self._payment_service = USDCPaymentService(
-                network=self.network,
-                usdc_client=None,
-            )
-        return self._payment_service
+        return self.payment_service
     
     def create_payment_intent(
         self,
@@ -837,7 +766,7 @@ def get_escrow_client(
         amount: int,  # microUSDC
         description: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> 'PaymentIntent':
+    ) -> PaymentIntent:
         """
         Create a payment intent for escrow.
         
@@ -871,7 +800,7 @@ def get_escrow_client(
         self,
         escrow_address: str,
         payment_intent_id: str,
-    ) -> 'EscrowPayment':
+    ) -> EscrowPayment:
         """
         Track an escrow payment.
         
@@ -908,7 +837,7 @@ def get_escrow_client(
         self,
         payment_intent_id: str,
         max_retries: int = 3,
-    ) -> 'PaymentResult':
+    ) -> PaymentResult:
         """
         Execute payment with confirmation tracking.
         
@@ -925,13 +854,11 @@ def get_escrow_client(
         
         result = payment_service.execute_payment_intent(payment_intent_id)
         
-        if not result.success and max_retries > 0:
-            import time
-            time.sleep(1)  # Brief delay
-            return self.execute_payment_with_confirmation(
-                payment_intent_id,
-                max_retries=max_retries - 1,
-            )
+        for attempt in range(max_retries):
+            if result.success:
+                break
+            time.sleep(0.2 * 2 ** attempt)  # Exponential backoff
+            result = payment_service.execute_payment_intent(payment_intent_id)
         
         return result
     
@@ -978,7 +905,7 @@ def get_escrow_client(
         callback_url: Optional[str] = None,
         auto_reload: bool = False,
         auto_reload_amount: Optional[int] = None,
-    ) -> 'BalanceNotification':
+    ) -> BalanceNotification:
         """
         Setup balance notification for a wallet.
         
@@ -1020,7 +947,7 @@ def get_escrow_client(
         self,
         wallet_address: str,
         limit: int = 100,
-    ) -> List['Payment']:
+    ) -> List[Payment]:
         """
         Get payment history for a wallet.
         
@@ -1039,6 +966,28 @@ def get_escrow_client(
         )
 
 
+# ============ Factory ============
+
+def get_escrow_client(
+    program_id: Optional[str] = None,
+    network: str = "devnet",
+) -> EscrowClient:
+    """
+    Get an EscrowClient instance.
+    
+    Args:
+        program_id: Optional program ID override
+        network: Network name
+        
+    Returns:
+        Configured EscrowClient
+    """
+    return EscrowClient(
+        program_id=program_id,
+        network=network,
+    )
+
+
 # ============ Helper Functions ============
 
 def get_escrow_with_payment_service(
@@ -1065,7 +1014,6 @@ def get_escrow_with_payment_service(
     )
     
     # Configure payment service
-    from .usdc_payment import USDCPaymentService, MultisigConfig
     payment_service = client.get_payment_service()
     
     multisig_config = MultisigConfig(
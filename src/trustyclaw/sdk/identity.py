@@ -36,7 +36,7 @@ class IdentityStatus(Enum):
     PENDING = "pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentIdentity:
     """
     Represents an agent's identity in TrustyClaw.
@@ -96,22 +96,21 @@ class KeypairManager:
             with open(path, 'rb') as f:
                 data = f.read()
             
-            # Try JSON format first
-            try:
-                json_data = json.loads(data)
+            # Pick the format from the file's shape rather than by trial decoding
+            text = data.strip()
+            if len(data) == 64:
+                # Raw bytes
+                secret_key = data
+            elif text[:1] in (b'[', b'{'):
+                json_data = json.loads(text)
                 if isinstance(json_data, dict) and 'secret_key' in json_data:
                     # JSON format with secret_key
                     secret_key = bytes(json_data['secret_key'])
                 else:
                     # Array format
                     secret_key = bytes(json_data)
-            except (json.JSONDecodeError, TypeError):
-                # Try base64
-                try:
-                    secret_key = base64.b64decode(data)
-                except Exception:
-                    # Raw bytes
-                    secret_key = data
+            else:
+                secret_key = base64.b64decode(text)
             
             # Validate key length
             if len(secret_key) != 64:
@@ -28,6 +28,7 @@ Usage:
     >>> new_score = engine.add_review("agent-wallet", review)
 """
 
+import heapq
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -35,6 +36,15 @@ from enum import Enum
 from typing import Optional
 
 
+# Star strings for ratings 0-5 and score bars for 0-20 filled cells,
+# built once instead of per render
+_STARS = tuple("⭐" * i for i in range(6))
+_BAR_LENGTH = 20
+_SCORE_BARS = tuple(
+    "█" * i + "░" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)
+)
+
+
 class Rating(Enum):
     """Rating values"""
     ONE_STAR = 1
@@ -44,7 +54,7 @@ class Rating(Enum):
     FIVE_STARS = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """
     A review from a completed rental.
@@ -81,7 +91,7 @@ class Review:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ReputationScore:
     """
     Reputation score for an agent.
@@ -95,7 +105,14 @@ class ReputationScore:
     reputation_score: float = 50.0  # Default for new agents
     last_updated: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     reviews: list[Review] = field(default_factory=list)
-    
+    # Running totals so each new review updates the averages in O(1)
+    _rating_sum: int = field(default=0, init=False, repr=False, compare=False)
+    _on_time_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._rating_sum = sum(r.rating for r in self.reviews)
+        self._on_time_count = sum(1 for r in self.reviews if r.completed_on_time)
+
     def calculate_score(self) -> float:
         """
         Calculate final reputation score.
@@ -192,6 +209,19 @@ class ReputationEngine:
             agent_id: Agent's wallet or ID
             review: Review data
             
+        Returns:
+            Updated ReputationScore
+        """
+        return self.add_reviews(agent_id, [review])
+    
+    def add_reviews(self, agent_id: str, reviews: list[Review]) -> ReputationScore:
+        """
+        Add several reviews and update the agent's score once.
+        
+        Args:
+            agent_id: Agent's wallet or ID
+            reviews: Review data, oldest first
+            
         Returns:
             Updated ReputationScore
         """
@@ -201,24 +231,25 @@ class ReputationEngine:
         
         score = self._scores[agent_id]
         
-        # Add review
+        # Add reviews
         if agent_id not in self._reviews:
             self._reviews[agent_id] = []
-        self._reviews[agent_id].append(review)
-        score.reviews.append(review)
+        self._reviews[agent_id].extend(reviews)
+        score.reviews.extend(reviews)
+        
+        # Fold the new reviews into the running totals
+        for review in reviews:
+            score._rating_sum += review.rating
+            if review.completed_on_time:
+                score._on_time_count += 1
         
         # Update counts
         score.total_reviews = len(score.reviews)
         
-        # Calculate average rating
-        if score.reviews:
-            ratings = [r.rating for r in score.reviews]
-            score.average_rating = sum(ratings) / len(ratings)
-        
-        # Calculate on-time percentage
-        completed = [r for r in score.reviews if r.completed_on_time]
-        if score.reviews:
-            score.on_time_percentage = (len(completed) / len(score.reviews)) * 100
+        # Calculate average rating and on-time percentage
+        if score.total_reviews:
+            score.average_rating = score._rating_sum / score.total_reviews
+            score.on_time_percentage = (score._on_time_count / score.total_reviews) * 100
         
         # Recalculate final score
         score.calculate_score()
@@ -248,12 +279,12 @@ class ReputationEngine:
         Returns:
             List of (agent_id, score) tuples, sorted by score descending
         """
-        sorted_agents = sorted(
+        top_agents = heapq.nlargest(
+            n,
             self._scores.items(),
             key=lambda x: x[1].reputation_score,
-            reverse=True
         )
-        return [(agent, score.reputation_score) for agent, score in sorted_agents[:n]]
+        return [(agent, score.reputation_score) for agent, score in top_agents]
     
     def format_score(self, agent_id: str) -> str:
         """
@@ -270,11 +301,10 @@ class ReputationEngine:
             return f"@{agent_id}: No reputation yet (50/100)"
         
         # Create score bar
-        bar_length = 20
-        filled = int(score.reputation_score / 100 * bar_length)
-        bar = "█" * filled + "░" * (bar_length - filled)
+        filled = int(score.reputation_score / 100 * _BAR_LENGTH)
+        bar = _SCORE_BARS[min(max(filled, 0), _BAR_LENGTH)]
         
-        stars = "⭐" * int(score.average_rating)
+        stars = _STARS[min(max(int(score.average_rating), 0), 5)]
         
         return f"""
 **@{agent_id}** Reputation
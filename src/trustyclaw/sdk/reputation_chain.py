@@ -36,6 +36,11 @@ class ReputationError(Exception):
 # Program ID for the reputation program
 REPUTATION_PROGRAM_ID = "REPUT1111111111111111111111111111111111111"
 
+# Precompiled account layouts (see ReputationScoreData / ReviewData).
+# 's' fields are truncated / NUL-padded by struct itself.
+_SCORE_STRUCT = struct.Struct('<64sIIIIIIII')
+_REVIEW_STRUCT = struct.Struct('<32s32s32s32sIIII32sI')
+
 
 @dataclass
 class ReputationScoreData:
@@ -52,9 +57,8 @@ class ReputationScoreData:
     
     def to_bytes(self) -> bytes:
         """Serialize to bytes (9 fields: 64s + 8 I)"""
-        return struct.pack(
-            '<64sIIIIIIII',
-            self.agent_address.encode('utf-8')[:64].ljust(64, b'\0'),
+        return _SCORE_STRUCT.pack(
+            self.agent_address.encode('utf-8'),
             self.total_reviews,
             int(self.average_rating * 100),
             int(self.on_time_percentage * 100),
@@ -68,7 +72,7 @@ class ReputationScoreData:
     @classmethod
     def from_bytes(cls, data: bytes) -> 'ReputationScoreData':
         """Deserialize from bytes"""
-        unpacked = struct.unpack('<64sIIIIIIII', data)
+        unpacked = _SCORE_STRUCT.unpack(data)
         return cls(
             agent_address=unpacked[0].decode('utf-8').rstrip('\0'),
             total_reviews=unpacked[1],
@@ -105,24 +109,23 @@ class ReviewData:
     
     def to_bytes(self) -> bytes:
         """Serialize to bytes (10 fields: 4*32s + 4*I + 32s + I)"""
-        return struct.pack(
-            '<32s32s32s32sIIII32sI',
-            self.review_id.encode('utf-8')[:32].ljust(32, b'\0'),
-            self.provider.encode('utf-8')[:32].ljust(32, b'\0'),
-            self.reviewer.encode('utf-8')[:32].ljust(32, b'\0'),
-            b'\0' * 32,
+        return _REVIEW_STRUCT.pack(
+            self.review_id.encode('utf-8'),
+            self.provider.encode('utf-8'),
+            self.reviewer.encode('utf-8'),
+            b'',
             self.rating,
             int(self.completed_on_time),
             self.positive_votes,
             self.negative_votes,
-            self.comment_hash.encode('utf-8')[:32].ljust(32, b'\0'),
+            self.comment_hash.encode('utf-8'),
             self.timestamp,
         )
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'ReviewData':
         """Deserialize from bytes"""
-        unpacked = struct.unpack('<32s32s32s32sIIII32sI', data)
+        unpacked = _REVIEW_STRUCT.unpack(data)
         return cls(
             review_id=unpacked[0].decode('utf-8').rstrip('\0'),
             provider=unpacked[1].decode('utf-8').rstrip('\0'),
@@ -8,10 +8,18 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 from enum import Enum
-import uuid
+import secrets
+import heapq
+import bisect
 import hashlib
 import json
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class ReviewStatus(Enum):
     """Review lifecycle status"""
@@ -30,7 +38,7 @@ class DisputeResolution(Enum):
     ESCALATED = "escalated"  # Sent to arbitration
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """A complete review with full lifecycle tracking"""
     review_id: str
@@ -72,7 +80,7 @@ class Review:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewDispute:
     """A dispute filed against a review"""
     dispute_id: str
@@ -87,7 +95,7 @@ class ReviewDispute:
     resolved_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewVote:
     """A vote on whether a review is helpful"""
     vote_id: str
@@ -97,6 +105,38 @@ class ReviewVote:
     voted_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+# Always reported in quality_breakdown, even at zero
+_QUALITY_LEVELS = ("excellent", "good", "fair", "poor")
+
+
+class _ProviderAgg:
+    """Running totals over a provider's submitted reviews"""
+    __slots__ = ("count", "sum_rating", "sum_on_time", "sum_helpful", "sum_unhelpful", "quality_counts")
+    
+    def __init__(self):
+        self.count = 0
+        self.sum_rating = 0
+        self.sum_on_time = 0
+        self.sum_helpful = 0
+        self.sum_unhelpful = 0
+        self.quality_counts = dict.fromkeys(_QUALITY_LEVELS, 0)
+    
+    def add(self, review: Review, sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) a review's contribution"""
+        self.count += sign
+        self.sum_rating += sign * review.rating
+        self.sum_on_time += sign * review.completed_on_time
+        self.sum_helpful += sign * review.helpful_votes
+        self.sum_unhelpful += sign * review.unhelpful_votes
+        quality = review.output_quality
+        count = self.quality_counts.get(quality, 0) + sign
+        if count or quality in _QUALITY_LEVELS:
+            self.quality_counts[quality] = count
+        else:
+            # Non-standard qualities only appear while a review carries them
+            self.quality_counts.pop(quality, None)
+
+
 class ReviewService:
     """
     Complete review management service.
@@ -112,8 +152,13 @@ class ReviewService:
         self.mock = mock
         self._reviews: Dict[str, Review] = {}
         self._disputes: Dict[str, ReviewDispute] = {}
+        self._dispute_ids_by_review: Dict[str, List[str]] = {}
         self._votes: Dict[str, ReviewVote] = {}
+        # Kept in created_at order so get_agent_reviews can read newest-first
         self._review_ids_by_agent: Dict[str, List[str]] = {}
+        self._indexed_review_ids: set = set()
+        # Per-provider totals over SUBMITTED reviews, kept current on every change
+        self._agg: Dict[str, _ProviderAgg] = {}
         
         if mock:
             self._init_mock_data()
@@ -148,7 +193,23 @@ class ReviewService:
         
         for review in mock_reviews:
             self._reviews[review.review_id] = review
-            self._review_ids_by_agent.setdefault(review.provider, []).append(review.review_id)
+            self._index_agent_review(review)
+            self._provider_agg(review.provider).add(review)
+    
+    def _index_agent_review(self, review: Review):
+        """Insert a review id into its provider's created_at-ordered list, once"""
+        if review.review_id in self._indexed_review_ids:
+            return
+        self._indexed_review_ids.add(review.review_id)
+        ids = self._review_ids_by_agent.setdefault(review.provider, [])
+        bisect.insort(ids, review.review_id, key=lambda rid: self._reviews[rid].created_at)
+    
+    def _provider_agg(self, provider: str) -> _ProviderAgg:
+        """Get or create the running totals for a provider"""
+        agg = self._agg.get(provider)
+        if agg is None:
+            agg = self._agg[provider] = _ProviderAgg()
+        return agg
     
     # ============ Review Operations ============
     
@@ -177,7 +238,7 @@ class ReviewService:
         Returns:
             Created Review
         """
-        review_id = f"review-{uuid.uuid4().hex[:8]}"
+        review_id = f"review-{secrets.token_hex(4)}"
         
         review = Review(
             review_id=review_id,
@@ -192,6 +253,7 @@ class ReviewService:
         )
         
         self._reviews[review_id] = review
+        self._provider_agg(provider)
         return review
     
     def submit_review(self, review_id: str) -> Review:
@@ -208,10 +270,12 @@ class ReviewService:
             raise ValueError(f"Review {review_id} not found")
         
         review = self._reviews[review_id]
+        if review.status is not ReviewStatus.SUBMITTED:
+            self._provider_agg(review.provider).add(review)
         review.status = ReviewStatus.SUBMITTED
         
         # Add to agent's review list
-        self._review_ids_by_agent.setdefault(review.provider, []).append(review_id)
+        self._index_agent_review(review)
         
         return review
     
@@ -236,16 +300,19 @@ class ReviewService:
         Returns:
             List of reviews
         """
-        review_ids = self._review_ids_by_agent.get(agent_address, [])
+        review_ids = self._review_ids_by_agent.get(agent_address, ())
         
+        # Walk newest-first and stop once the page is full
         reviews = []
-        for rid in review_ids:
+        for rid in reversed(review_ids):
+            if len(reviews) >= limit:
+                break
             review = self._reviews.get(rid)
             if review:
                 if status is None or review.status == status:
                     reviews.append(review)
         
-        return sorted(reviews, key=lambda r: r.created_at, reverse=True)[:limit]
+        return reviews
     
     # ============ Dispute Operations ============
     
@@ -277,7 +344,7 @@ class ReviewService:
             raise ValueError("Can only dispute submitted reviews")
         
         dispute = ReviewDispute(
-            dispute_id=f"dispute-{uuid.uuid4().hex[:8]}",
+            dispute_id=f"dispute-{secrets.token_hex(4)}",
             review_id=review_id,
             filed_by=filed_by,
             reason=reason,
@@ -285,8 +352,10 @@ class ReviewService:
         )
         
         self._disputes[dispute.dispute_id] = dispute
+        self._dispute_ids_by_review.setdefault(review_id, []).append(dispute.dispute_id)
         
-        # Update review status
+        # Disputed reviews stop counting towards the provider's rating
+        self._provider_agg(review.provider).add(review, -1)
         review.status = ReviewStatus.DISPUTED
         review.dispute_reason = reason
         
@@ -338,8 +407,8 @@ class ReviewService:
     def get_review_disputes(self, review_id: str) -> List[ReviewDispute]:
         """Get all disputes for a review"""
         return [
-            d for d in self._disputes.values()
-            if d.review_id == review_id
+            self._disputes[did]
+            for did in self._dispute_ids_by_review.get(review_id, ())
         ]
     
     # ============ Voting Operations ============
@@ -365,7 +434,7 @@ class ReviewService:
             raise ValueError(f"Review {review_id} not found")
         
         vote = ReviewVote(
-            vote_id=f"vote-{uuid.uuid4().hex[:8]}",
+            vote_id=f"vote-{secrets.token_hex(4)}",
             review_id=review_id,
             voter=voter,
             helpful=helpful,
@@ -375,21 +444,26 @@ class ReviewService:
         
         # Update review vote counts
         review = self._reviews[review_id]
+        counted = review.status is ReviewStatus.SUBMITTED
         if helpful:
             review.helpful_votes += 1
+            if counted:
+                self._agg[review.provider].sum_helpful += 1
         else:
             review.unhelpful_votes += 1
+            if counted:
+                self._agg[review.provider].sum_unhelpful += 1
         
         return vote
     
     def get_review_votes(self, review_id: str) -> Dict[str, int]:
         """Get vote summary for a review"""
-        votes = [v for v in self._votes.values() if v.review_id == review_id]
+        # vote_review keeps per-review tallies, so no scan of all votes
+        review = self._reviews.get(review_id)
+        if not review:
+            return {"helpful": 0, "unhelpful": 0}
         
-        helpful = sum(1 for v in votes if v.helpful)
-        unhelpful = sum(1 for v in votes if not v.helpful)
-        
-        return {"helpful": helpful, "unhelpful": unhelpful}
+        return {"helpful": review.helpful_votes, "unhelpful": review.unhelpful_votes}
     
     # ============ Aggregation Operations ============
     
@@ -401,6 +475,9 @@ class ReviewService:
         """
         Calculate aggregated rating for an agent.
         
+        Reads the provider's running totals, so the cost does not grow
+        with the number of reviews.
+        
         Args:
             agent_address: Agent's wallet address
             min_reviews: Minimum reviews needed
@@ -408,15 +485,13 @@ class ReviewService:
         Returns:
             Rating summary dict
         """
-        reviews = self.get_agent_reviews(
-            agent_address,
-            status=ReviewStatus.SUBMITTED,
-        )
+        agg = self._agg.get(agent_address) or _ProviderAgg()
+        count = agg.count
         
-        if len(reviews) < min_reviews:
+        if count < min_reviews:
             return {
                 "agent": agent_address,
-                "total_reviews": len(reviews),
+                "total_reviews": count,
                 "average_rating": 0,
                 "on_time_rate": 0,
                 "quality_breakdown": {},
@@ -424,20 +499,14 @@ class ReviewService:
             }
         
         # Calculate averages
-        avg_rating = sum(r.rating for r in reviews) / len(reviews)
-        on_time_rate = sum(1 for r in reviews if r.completed_on_time) / len(reviews) * 100
-        
-        # Quality breakdown
-        quality_counts = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
-        for r in reviews:
-            quality_counts[r.output_quality] = quality_counts.get(r.output_quality, 0) + 1
+        avg_rating = agg.sum_rating / count
+        on_time_rate = agg.sum_on_time / count * 100
         
         # Calculate helpful rate
-        total_votes = sum(r.helpful_votes + r.unhelpful_votes for r in reviews)
+        total_votes = agg.sum_helpful + agg.sum_unhelpful
         helpful_rate = 0
         if total_votes > 0:
-            helpful_votes = sum(r.helpful_votes for r in reviews)
-            helpful_rate = helpful_votes / total_votes * 100
+            helpful_rate = agg.sum_helpful / total_votes * 100
         
         # Determine rating tier
         if avg_rating >= 4.5:
@@ -451,11 +520,11 @@ class ReviewService:
         
         return {
             "agent": agent_address,
-            "total_reviews": len(reviews),
+            "total_reviews": count,
             "average_rating": round(avg_rating, 2),
             "on_time_rate": round(on_time_rate, 1),
             "helpful_rate": round(helpful_rate, 1),
-            "quality_breakdown": quality_counts,
+            "quality_breakdown": dict(agg.quality_counts),
             "rating": rating,
         }
     
@@ -469,23 +538,9 @@ class ReviewService:
         Returns:
             List of agent rating summaries
         """
-        all_providers = set()
-        for review in self._reviews.values():
-            all_providers.add(review.provider)
-        
-        agents = []
-        for provider in all_providers:
-            rating = self.calculate_agent_rating(provider)
-            agents.append(rating)
-        
-        # Sort by average rating
-        sorted_agents = sorted(
-            agents,
-            key=lambda a: a["average_rating"],
-            reverse=True,
-        )
+        agents = [self.calculate_agent_rating(provider) for provider in self._agg]
         
-        return sorted_agents[:n]
+        return heapq.nlargest(n, agents, key=lambda a: a["average_rating"])
     
     def export_reviews_json(self, agent_address: str = None) -> str:
         """
@@ -502,10 +557,10 @@ class ReviewService:
         else:
             reviews = list(self._reviews.values())
         
-        return json.dumps(
-            [r.to_dict() for r in reviews],
-            indent=2,
-        )
+        if HAS_ORJSON:
+            # orjson encodes the dataclasses and enums natively, in to_dict's shape
+            return orjson.dumps(reviews, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps([r.to_dict() for r in reviews], indent=2)
 
 
 def get_review_service(mock: bool = True) -> ReviewService:
@@ -5,8 +5,9 @@ Real Solana blockchain integration for escrow operations.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from enum import Enum
+from functools import lru_cache
 import os
 import base64
 
@@ -51,11 +52,31 @@ class TransactionInfo:
         return f"https://explorer.solana.com/tx/{self.signature}?cluster=devnet"
 
 
+@lru_cache(maxsize=8)
+def get_rpc_client(url: str) -> SolanaClient:
+    """Shared solana-py client per endpoint, so its HTTP connection pool is reused"""
+    return SolanaClient(url)
+
+
+@lru_cache(maxsize=4096)
+def _find_escrow_pda(seed: str, provider: str, skill_id: str, program_id: str) -> str:
+    """Memoized find_program_address; the bump search is pure in its inputs"""
+    provider_bytes = bytes(Pubkey.from_string(provider))
+    seed_bytes = skill_id.encode()[:32]
+    pda, _bump = Pubkey.find_program_address(
+        [seed.encode(), provider_bytes, seed_bytes],
+        Pubkey.from_string(program_id),
+    )
+    return str(pda)
+
+
 class SolanaRPCClient:
     """Real Solana RPC client for TrustyClaw operations"""
     
     USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
     ESCROW_SEED = "trustyclaw-escrow"
+    # getMultipleAccounts accepts at most 100 keys per request
+    MAX_MULTIPLE_ACCOUNTS = 100
     
     def __init__(
         self,
@@ -65,7 +86,7 @@ class SolanaRPCClient:
     ):
         self.network = network
         self.commitment = commitment
-        self.client = SolanaClient(str(network.value))
+        self.client = get_rpc_client(str(network.value))
         
         self._keypair: Optional[Keypair] = None
         if keypair_path and os.path.exists(keypair_path):
@@ -76,11 +97,10 @@ class SolanaRPCClient:
         with open(path, 'rb') as f:
             keypair_data = f.read()
         
-        try:
-            self._keypair = Keypair.from_bytes(keypair_data)
-        except Exception:
-            secret = base64.b64decode(keypair_data)
-            self._keypair = Keypair.from_bytes(secret)
+        # Raw 64-byte secret, otherwise base64 text
+        if len(keypair_data) != 64:
+            keypair_data = base64.b64decode(keypair_data.strip())
+        self._keypair = Keypair.from_bytes(keypair_data)
     
     @property
     def address(self) -> Optional[str]:
@@ -102,6 +122,24 @@ class SolanaRPCClient:
             usdc_balance=usdc_balance,
         )
     
+    def get_balances(self, addresses: List[str]) -> List[WalletInfo]:
+        """Get SOL balances for many addresses via batched getMultipleAccounts"""
+        wallets = []
+        step = self.MAX_MULTIPLE_ACCOUNTS
+        for start in range(0, len(addresses), step):
+            chunk = addresses[start:start + step]
+            resp = self.client.get_multiple_accounts(
+                [Pubkey.from_string(a) for a in chunk],
+                commitment=self.commitment,
+            )
+            for address, account in zip(chunk, resp.value):
+                wallets.append(WalletInfo(
+                    address=address,
+                    lamports=account.lamports if account else 0,
+                ))
+        
+        return wallets
+    
     def get_token_balance(self, address: str, mint: str) -> float:
         """Get token balance for a specific mint"""
         pubkey = Pubkey.from_string(address)
@@ -140,16 +178,8 @@ class SolanaRPCClient:
     
     def derive_escrow_pda(self, provider: str, skill_id: str) -> str:
         """Derive a PDA for an escrow account (provider is base58 pubkey string)."""
-        provider_pubkey = Pubkey.from_string(provider)
-        provider_bytes = bytes(provider_pubkey)
-        seed_bytes = skill_id.encode()[:32]
         program_id_str = os.environ.get("ESCROW_PROGRAM_ID", "11111111111111111111111111111111")
-        program_pubkey = Pubkey.from_string(program_id_str)
-        pda, _bump = Pubkey.find_program_address(
-            [self.ESCROW_SEED.encode(), provider_bytes, seed_bytes],
-            program_pubkey,
-        )
-        return str(pda)
+        return _find_escrow_pda(self.ESCROW_SEED, provider, skill_id, program_id_str)
     
     def get_recent_blockhash(self) -> str:
         """Get recent blockhash for transaction building"""
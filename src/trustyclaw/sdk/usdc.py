@@ -5,19 +5,21 @@ Real SPL Token operations for USDC on Solana.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from enum import Enum
 import os
 import base64
 import time
 import hashlib
 
+from .solana import get_rpc_client
+
 try:
-    from solana.rpc.api import Client as SolanaClient
     from solana.rpc.commitment import Confirmed, Finalized
     from solana.rpc.types import TokenAccountOpts
     from solders.keypair import Keypair
     from solders.pubkey import Pubkey
+    from spl.token.instructions import get_associated_token_address
     HAS_SOLANA = True
     HAS_SPL_TOKEN = True
 except ImportError:
@@ -71,6 +73,8 @@ class USDCClient:
     
     DEVNET_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
     MAINNET_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    # getMultipleAccounts accepts at most 100 keys per request
+    MAX_MULTIPLE_ACCOUNTS = 100
     
     def __init__(
         self,
@@ -87,7 +91,8 @@ class USDCClient:
             self.mint = self.MAINNET_MINT
         
         if HAS_SOLANA:
-            self.client = SolanaClient(f"https://api.{network}.solana.com")
+            # Shared per endpoint, so every USDCClient reuses one connection pool
+            self.client = get_rpc_client(self.endpoint)
         else:
             self.client = None
         
@@ -118,26 +123,44 @@ class USDCClient:
     
     def get_balance(self, wallet_address: str) -> float:
         """Get USDC balance for a wallet"""
+        # Same token-account resolution and parsing as the batched lookup
+        return self.get_balances([wallet_address])[wallet_address]
+    
+    def get_balances(self, wallet_addresses: List[str]) -> Dict[str, float]:
+        """Get USDC balances for many wallets via batched getMultipleAccounts"""
+        balances = {address: 0.0 for address in wallet_addresses}
         if not self.client:
-            return 0.0
+            return balances
         
-        try:
-            resp = self.client.get_token_accounts_by_owner(
-                wallet_address,
-                {"mint": self.mint},
-                encoding="jsonParsed",
-                commitment=self.commitment,
-            )
+        # Look up each wallet's associated token account
+        token_accounts = {}
+        mint = Pubkey.from_string(self.mint)
+        for address in balances:
+            try:
+                owner = Pubkey.from_string(address)
+            except ValueError:
+                continue
+            token_accounts[address] = get_associated_token_address(owner, mint)
+        
+        wallets = list(token_accounts)
+        step = self.MAX_MULTIPLE_ACCOUNTS
+        for start in range(0, len(wallets), step):
+            chunk = wallets[start:start + step]
+            try:
+                resp = self.client.get_multiple_accounts_json_parsed(
+                    [token_accounts[w] for w in chunk],
+                    commitment=self.commitment,
+                )
+            except Exception:
+                continue
             
-            if resp.value and len(resp.value) > 0:
-                account_data = resp.value[0].account.data
-                if isinstance(account_data, dict):
-                    info = account_data.get('parsed', {}).get('info', {})
-                    return float(info.get('tokenAmount', {}).get('uiAmount', 0))
-        except:
-            pass
+            for address, account in zip(chunk, resp.value):
+                parsed = getattr(getattr(account, 'data', None), 'parsed', None)
+                if isinstance(parsed, dict):
+                    info = parsed.get('info', {})
+                    balances[address] = float(info.get('tokenAmount', {}).get('uiAmount') or 0)
         
-        return 0.0
+        return balances
     
     def find_associated_token_account(self, wallet_address: str) -> Optional[str]:
         """Find the associated token account for a wallet"""
@@ -184,7 +207,8 @@ class USDCClient:
     
     def amount_to_raw(self, amount: float) -> int:
         """Convert UI amount to raw units"""
-        return int(amount * (10 ** self.decimals()))
+        # round, not int: e.g. 0.000249 * 10**6 is 248.99999999999997
+        return round(amount * (10 ** self.decimals()))
     
     def raw_to_amount(self, raw: int) -> float:
         """Convert raw units to UI amount"""
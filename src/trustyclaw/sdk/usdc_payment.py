@@ -15,12 +15,21 @@ Features:
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple
 from datetime import timedelta
-import uuid
+from itertools import islice
+import bisect
+import time
+import secrets
 import hashlib
 import json
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     from solana.rpc.api import Client as SolanaClient
     from solana.rpc.commitment import Confirmed, Finalized
@@ -59,7 +68,7 @@ class EscrowPaymentStatus(Enum):
     DISPUTED = "disputed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentIntent:
     """
     Payment intent for USDC transfers.
@@ -114,7 +123,7 @@ class PaymentIntent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowPayment:
     """
     Escrow payment record.
@@ -173,7 +182,7 @@ class EscrowPayment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentResult:
     """
     Result of a payment operation.
@@ -199,7 +208,7 @@ class PaymentResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BalanceNotification:
     """
     Balance notification configuration.
@@ -219,10 +228,10 @@ class BalanceNotification:
     @property
     def threshold_micro(self) -> int:
         """Threshold in microUSDC"""
-        return int(self.threshold_usd * 1_000_000)
+        return round(self.threshold_usd * 1_000_000)
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """
     Historical payment record.
@@ -260,7 +269,7 @@ class Payment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MultisigConfig:
     """Multi-signature configuration for large transactions"""
     threshold_usd: float  # Apply multisig above this amount
@@ -271,7 +280,7 @@ class MultisigConfig:
     @property
     def threshold_micro(self) -> int:
         """Threshold in microUSDC"""
-        return int(self.threshold_usd * 1_000_000)
+        return round(self.threshold_usd * 1_000_000)
 
 
 class USDCPaymentService:
@@ -300,6 +309,7 @@ class USDCPaymentService:
     DEFAULT_THRESHOLD_USD = 10.0  # Alert when balance below $10
     DEFAULT_AUTO_RELOAD_AMOUNT = 100_000_000  # $100
     MULTISIG_THRESHOLD_USD = 1000.0  # Require multisig above $1000
+    BALANCE_CACHE_TTL = 5.0  # Seconds a fetched balance is reused
     
     def __init__(
         self,
@@ -317,7 +327,7 @@ class USDCPaymentService:
         """
         self.network = network
         self.usdc_client = usdc_client or USDCClient(network=network)
-        self.multisig_config = multsig_config or MultisigConfig(
+        self.multisig_config = multisig_config or MultisigConfig(
             threshold_usd=self.MULTISIG_THRESHOLD_USD,
             required_signers=[],
             required_count=2,
@@ -327,8 +337,13 @@ class USDCPaymentService:
         self._payment_intents: Dict[str, PaymentIntent] = {}
         self._escrow_payments: Dict[str, EscrowPayment] = {}
         self._payment_history: List[Payment] = []
+        # Per-wallet payments (sent or received), kept in created_at order
+        self._payments_by_wallet: Dict[str, List[Payment]] = {}
         self._balance_notifications: Dict[str, BalanceNotification] = {}
-        self._notification_callbacks: List[Callable] = []
+        # Replaced, never mutated, so a dispatch loop always sees a fixed snapshot
+        self._notification_callbacks: Tuple[Callable, ...] = ()
+        # wallet -> (balance_usd, time.monotonic() when fetched)
+        self._balance_cache: Dict[str, Tuple[float, float]] = {}
         
         # Load notification callbacks
         self._load_notification_callbacks()
@@ -374,15 +389,12 @@ class USDCPaymentService:
         if amount < 1_000:  # Minimum 0.001 USDC
             raise PaymentError("Amount below minimum (1,000 microUSDC)")
         
-        # Check for large transaction requiring multisig
-        amount_usd = amount / 1_000_000
-        requires_multisig = (
-            self.multisig_config.threshold_usd > 0 and
-            amount_usd >= self.multisig_config.threshold_usd
-        )
+        # Check for large transaction requiring multisig (in exact microUSDC)
+        threshold_micro = self.multisig_config.threshold_micro
+        requires_multisig = threshold_micro > 0 and amount >= threshold_micro
         
         # Generate unique intent ID
-        intent_id = f"pi-{uuid.uuid4().hex[:16]}"
+        intent_id = f"pi-{secrets.token_hex(8)}"
         
         # Create intent
         intent = PaymentIntent(
@@ -460,18 +472,20 @@ class USDCPaymentService:
                 amount=intent.amount_usd,
             )
             
-            # Update intent
+            # Update intent; the transfer result is already confirmed,
+            # so one clock read stamps both transitions
+            now = datetime.utcnow().isoformat()
             intent.status = PaymentStatus.PROCESSING
-            intent.executed_at = datetime.utcnow().isoformat()
+            intent.executed_at = now
             intent.signature = result.signature
             
             # Finalize
             intent.status = PaymentStatus.CONFIRMED
-            intent.confirmed_at = datetime.utcnow().isoformat()
+            intent.confirmed_at = now
             
             # Add to history
             payment = Payment(
-                payment_id=f"pay-{uuid.uuid4().hex[:12]}",
+                payment_id=f"pay-{secrets.token_hex(6)}",
                 from_wallet=intent.from_wallet,
                 to_wallet=intent.to_wallet,
                 amount=intent.amount,
@@ -482,6 +496,16 @@ class USDCPaymentService:
                 confirmed_at=intent.confirmed_at,
             )
             self._payment_history.append(payment)
+            for wallet in {payment.from_wallet, payment.to_wallet}:
+                bisect.insort(
+                    self._payments_by_wallet.setdefault(wallet, []),
+                    payment,
+                    key=lambda p: p.created_at,
+                )
+            
+            # Both balances changed, so drop any cached reads
+            self._balance_cache.pop(intent.from_wallet, None)
+            self._balance_cache.pop(intent.to_wallet, None)
             
             return PaymentResult(
                 success=True,
@@ -732,18 +756,13 @@ class USDCPaymentService:
         Returns:
             List of Payment records
         """
-        payments = [
-            p for p in self._payment_history
-            if p.from_wallet == wallet_address or p.to_wallet == wallet_address
-        ]
+        # Newest first, straight off the created_at-ordered index
+        payments = reversed(self._payments_by_wallet.get(wallet_address, ()))
         
-        if status_filter:
-            payments = [p for p in payments if p.status == status_filter]
+        if status_filter is not None:
+            payments = (p for p in payments if p.status is status_filter)
         
-        # Sort by created_at descending
-        payments.sort(key=lambda p: p.created_at, reverse=True)
-        
-        return payments[:limit]
+        return list(islice(payments, limit))
     
     def get_all_payments(self, limit: int = 100) -> List[Payment]:
         """Get all payments (admin function)"""
@@ -809,7 +828,52 @@ class USDCPaymentService:
             return {"alert_sent": False, "reason": "No notification registered"}
         
         # Get current balance
+        balance = self._get_balance_cached(wallet_address)
+        
+        return self._notify_if_low(notification, balance, force)
+    
+    def check_all_balances_and_notify(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Check every registered wallet and trigger notifications if needed.
+        
+        Balances are fetched with one batched lookup instead of one
+        RPC round trip per wallet.
+        
+        Args:
+            force: Force notification even if recently notified
+            
+        Returns:
+            Notification result dict per wallet
+        """
+        balances = self.usdc_client.get_balances(list(self._balance_notifications))
+        now = time.monotonic()
+        for wallet, balance in balances.items():
+            self._balance_cache[wallet] = (balance, now)
+        
+        return {
+            wallet: self._notify_if_low(self._balance_notifications[wallet], balance, force)
+            for wallet, balance in balances.items()
+        }
+    
+    def _get_balance_cached(self, wallet_address: str) -> float:
+        """Get a wallet balance, reusing a read younger than BALANCE_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._balance_cache.get(wallet_address)
+        if cached and now - cached[1] < self.BALANCE_CACHE_TTL:
+            return cached[0]
+        
         balance = self.usdc_client.get_balance(wallet_address)
+        self._balance_cache[wallet_address] = (balance, now)
+        return balance
+    
+    def _notify_if_low(
+        self,
+        notification: BalanceNotification,
+        balance: float,
+        force: bool,
+    ) -> Dict[str, Any]:
+        """Apply threshold, rate limit and auto-reload for a fetched balance"""
+        wallet_address = notification.wallet_address
         balance_usd = balance  # USDC = $1
         
         # Check if below threshold
@@ -821,10 +885,12 @@ class USDCPaymentService:
                 "threshold": notification.threshold_usd,
             }
         
+        now = datetime.utcnow()
+        
         # Check rate limiting
         if notification.last_notified_at and not force:
             last_notified = datetime.fromisoformat(notification.last_notified_at)
-            if datetime.utcnow() - last_notified < timedelta(hours=1):
+            if now - last_notified < timedelta(hours=1):
                 return {
                     "alert_sent": False,
                     "reason": "Rate limited",
@@ -837,7 +903,7 @@ class USDCPaymentService:
             "wallet": wallet_address,
             "current_balance": balance_usd,
             "threshold": notification.threshold_usd,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
         }
         
         # Trigger callbacks
@@ -852,7 +918,7 @@ class USDCPaymentService:
             self._send_webhook(notification.callback_url, alert)
         
         # Update last notified
-        notification.last_notified_at = datetime.utcnow().isoformat()
+        notification.last_notified_at = alert["timestamp"]
         
         # Auto-reload if enabled
         if notification.auto_reload_enabled:
@@ -870,25 +936,24 @@ class USDCPaymentService:
         current_balance: float,
     ):
         """Execute auto-reload for a notification"""
-        # Check daily limits
+        now = datetime.utcnow()
+        today = now.date()
+        
+        # Check daily limits; a max of 0 keeps the one-reload-per-day default
         if notification.last_reloaded_at:
             last_date = datetime.fromisoformat(notification.last_reloaded_at).date()
-            if last_date == datetime.utcnow().date():
-                if notification.reload_count_today >= notification.auto_reload_max_daily:
+            if last_date == today:
+                if notification.reload_count_today >= max(notification.auto_reload_max_daily, 1):
                     return  # Daily limit reached
-        
-        # Check if we can reload (not already loaded today)
-        if notification.last_reloaded_at:
-            last_reloaded = datetime.fromisoformat(notification.last_reloaded_at)
-            if last_reloaded.date() == datetime.utcnow().date():
-                return  # Already reloaded today
+            else:
+                notification.reload_count_today = 0  # New day
         
         # Execute reload (create payment intent from funding source)
         # This would typically come from a linked payment method
         reload_amount = notification.auto_reload_amount
         
         # Update notification state
-        notification.last_reloaded_at = datetime.utcnow().isoformat()
+        notification.last_reloaded_at = now.isoformat()
         notification.reload_count_today += 1
         
         # Create record of reload
@@ -896,7 +961,7 @@ class USDCPaymentService:
             "type": "auto_reload",
             "wallet": notification.wallet_address,
             "amount": reload_amount,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": notification.last_reloaded_at,
         }
     
     def _send_webhook(self, url: str, payload: Dict[str, Any]):
@@ -907,7 +972,7 @@ class USDCPaymentService:
     
     def add_notification_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Add a notification callback function"""
-        self._notification_callbacks.append(callback)
+        self._notification_callbacks = (*self._notification_callbacks, callback)
     
     # ============ Multi-Signature Support ============
     
@@ -945,26 +1010,25 @@ class USDCPaymentService:
             return {"success": False, "error": "Signer not authorized"}
         
         # Collect signature
-        if "signatures_collected" not in intent.metadata:
-            intent.metadata["signatures_collected"] = {}
-        
-        intent.metadata["signatures_collected"][signer] = signature
+        sigs = intent.metadata.setdefault("signatures_collected", {})
+        sigs[signer] = signature
         
         # Check if we have enough signatures
-        sigs = intent.metadata["signatures_collected"]
-        if len(sigs) >= self.multisig_config.required_count:
+        collected = len(sigs)
+        required = self.multisig_config.required_count
+        if collected >= required:
             return {
                 "success": True,
                 "multisig_complete": True,
-                "signatures_collected": len(sigs),
+                "signatures_collected": collected,
                 "message": "Multisig complete, payment can be executed",
             }
         
         return {
             "success": True,
             "multisig_complete": False,
-            "signatures_collected": len(sigs),
-            "signatures_needed": self.multisig_config.required_count - len(sigs),
+            "signatures_collected": collected,
+            "signatures_needed": required - collected,
         }
     
     def initiate_recovery(
@@ -1016,10 +1080,7 @@ class USDCPaymentService:
         else:
             payments = self._payment_history
         
-        return json.dumps(
-            [p.to_dict() for p in payments],
-            indent=2,
-        )
+        return self._dumps_records(payments)
     
     def export_escrow_payments_json(self, wallet_address: Optional[str] = None) -> str:
         """Export escrow payments as JSON"""
@@ -1031,10 +1092,24 @@ class USDCPaymentService:
         else:
             escrows = list(self._escrow_payments.values())
         
-        return json.dumps(
-            [e.to_dict() for e in escrows],
-            indent=2,
-        )
+        return self._dumps_records(escrows)
+    
+    @staticmethod
+    def _dumps_records(records: List[Any]) -> str:
+        """
+        Encode records as a JSON array of their to_dict() forms.
+        
+        to_dict() runs from the encoder's default hook, so each dict is
+        built and dropped as the array is written instead of holding a
+        full list of dicts alongside the output.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(
+                records,
+                default=lambda r: r.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode()
+        return json.dumps(records, default=lambda r: r.to_dict(), indent=2)
 
 
 # ============ Factory Functions ============
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 from enum import Enum
+import heapq
 import uuid
 import json
 
@@ -358,27 +359,37 @@ class DiscoverySkill:
         Returns:
             List of matching skills
         """
-        skills = list(self._skills.values())
-        
-        if query:
-            query_lower = query.lower()
-            skills = [
-                s for s in skills
-                if query_lower in s.name.lower()
+        skills = self._filter_skills(
+            self._skills.values(), query, category, min_rating, max_price,
+        )
+        return sorted(skills, key=lambda s: s.rating, reverse=True)[:limit]
+    
+    def _filter_skills(
+        self,
+        skills,
+        query: str = None,
+        category: str = None,
+        min_rating: float = 0.0,
+        max_price: int = None,
+    ) -> List[Skill]:
+        """Apply all search criteria to skills in a single pass"""
+        query_lower = query.lower() if query else None
+        results = []
+        for s in skills:
+            if category and s.category != category:
+                continue
+            if min_rating > 0 and s.rating < min_rating:
+                continue
+            if max_price and s.price_per_task > max_price:
+                continue
+            if query_lower and not (
+                query_lower in s.name.lower()
                 or query_lower in s.description.lower()
                 or any(query_lower in t.lower() for t in s.tags)
-            ]
-        
-        if category:
-            skills = [s for s in skills if s.category == category]
-        
-        if min_rating > 0:
-            skills = [s for s in skills if s.rating >= min_rating]
-        
-        if max_price:
-            skills = [s for s in skills if s.price_per_task <= max_price]
-        
-        return sorted(skills, key=lambda s: s.rating, reverse=True)[:limit]
+            ):
+                continue
+            results.append(s)
+        return results
     
     # ============ Agent Profiles ============
     
@@ -412,11 +423,7 @@ class DiscoverySkill:
     
     def get_top_rated_agents(self, limit: int = 10) -> List[Agent]:
         """Get top rated agents"""
-        return sorted(
-            list(self._agents.values()),
-            key=lambda a: a.rating,
-            reverse=True,
-        )[:limit]
+        return heapq.nlargest(limit, self._agents.values(), key=lambda a: a.rating)
     
     def get_top_rated_skills(self, category: str = None, limit: int = 10) -> List[Skill]:
         """Get top rated skills"""
@@ -425,24 +432,16 @@ class DiscoverySkill:
         if category:
             skills = [s for s in skills if s.category == category]
         
-        return sorted(skills, key=lambda s: s.rating, reverse=True)[:limit]
+        return heapq.nlargest(limit, skills, key=lambda s: s.rating)
     
     def get_most_active_agents(self, limit: int = 10) -> List[Agent]:
         """Get most active agents (most completed tasks)"""
-        return sorted(
-            list(self._agents.values()),
-            key=lambda a: a.completed_tasks,
-            reverse=True,
-        )[:limit]
+        return heapq.nlargest(limit, self._agents.values(), key=lambda a: a.completed_tasks)
     
     def get_trending_skills(self, limit: int = 10) -> List[Skill]:
         """Get trending skills (recently popular)"""
         # Sort by recent review activity
-        return sorted(
-            list(self._skills.values()),
-            key=lambda s: s.review_count,
-            reverse=True,
-        )[:limit]
+        return heapq.nlargest(limit, self._skills.values(), key=lambda s: s.review_count)
     
     # ============ Recommendations ============
     
@@ -683,25 +682,7 @@ class DiscoverySkill:
             if s.agent_address in auto_negotiating_addresses
         ]
         
-        # Apply filters
-        if query:
-            query_lower = query.lower()
-            skills = [
-                s for s in skills
-                if query_lower in s.name.lower()
-                or query_lower in s.description.lower()
-                or any(query_lower in t.lower() for t in s.tags)
-            ]
-        
-        if category:
-            skills = [s for s in skills if s.category == category]
-        
-        if min_rating > 0:
-            skills = [s for s in skills if s.rating >= min_rating]
-        
-        if max_price:
-            skills = [s for s in skills if s.price_per_task <= max_price]
-        
+        skills = self._filter_skills(skills, query, category, min_rating, max_price)
         return sorted(skills, key=lambda s: s.rating, reverse=True)[:limit]
     
     def get_negotiation_info(self, agent_address: str) -> Dict[str, Any]:
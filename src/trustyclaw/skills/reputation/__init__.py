@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
 from enum import Enum
+import bisect
 import json
 import time
 
@@ -34,6 +35,17 @@ class ReputationTier(Enum):
     UNKNOWN = "unknown"   # 0-24
 
 
+# Lower score bound of each tier above UNKNOWN, ascending for bisect
+_TIER_THRESHOLDS = (25, 50, 75, 90)
+_TIER_VALUES = (
+    ReputationTier.UNKNOWN.value,
+    ReputationTier.NEW.value,
+    ReputationTier.VERIFIED.value,
+    ReputationTier.TRUSTED.value,
+    ReputationTier.ELITE.value,
+)
+
+
 @dataclass
 class ReputationMetrics:
     """Complete reputation metrics for an agent"""
@@ -79,7 +91,7 @@ class ReputationMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReputationBreakdown:
     """Breakdown of reputation by category"""
     agent_address: str
@@ -100,7 +112,7 @@ class ReputationBreakdown:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReputationHistory:
     """Historical reputation data point"""
     timestamp: str
@@ -155,8 +167,9 @@ class ReputationSkill:
         now = time.time()
         
         # Check cache
-        if agent_address in self._cache:
-            metrics, timestamp = self._cache[agent_address]
+        cached = self._cache.get(agent_address)
+        if cached is not None:
+            metrics, timestamp = cached
             if now - timestamp < self._cache_ttl:
                 return metrics
         
@@ -275,31 +288,14 @@ class ReputationSkill:
         
         if score is None:
             return ReputationTier.UNKNOWN.value
-        elif score >= 90:
-            return ReputationTier.ELITE.value
-        elif score >= 75:
-            return ReputationTier.TRUSTED.value
-        elif score >= 50:
-            return ReputationTier.VERIFIED.value
-        elif score >= 25:
-            return ReputationTier.NEW.value
-        else:
-            return ReputationTier.UNKNOWN.value
+        return self.get_tier_for_score(score)
 
     def get_tier_for_score(self, score: float) -> str:
         """
         Get tier name for a numeric score (for testing / display).
         Same logic as get_reputation_tier but without fetching from chain.
         """
-        if score >= 90:
-            return ReputationTier.ELITE.value
-        if score >= 75:
-            return ReputationTier.TRUSTED.value
-        if score >= 50:
-            return ReputationTier.VERIFIED.value
-        if score >= 25:
-            return ReputationTier.NEW.value
-        return ReputationTier.UNKNOWN.value
+        return _TIER_VALUES[bisect.bisect_right(_TIER_THRESHOLDS, score)]
 
     def get_top_reputed_agents(self, limit: int = 10) -> List[ReputationMetrics]:
         """